@@ -2,17 +2,45 @@
 
 from __future__ import annotations
 
-import argparse
 import asyncio
 import json
+import sys
+from typing import TYPE_CHECKING
 
 from polymarket_geo.logging_config import setup_logging
 from polymarket_geo.semantic.output_schema import GeoInferenceOutput
 
+if TYPE_CHECKING:
+    import argparse
+
 
 def main() -> None:
     setup_logging()
 
+    # Flag-less commands dispatch straight from argv; argparse is only built
+    # for commands that take options (or for --help / usage errors).
+    dispatch = {
+        "serve": _serve,
+        "run": lambda: asyncio.run(_run_once()),
+        "migrate": lambda: asyncio.run(_migrate()),
+    }
+    if len(sys.argv) == 2 and sys.argv[1] in dispatch:
+        dispatch[sys.argv[1]]()
+        return
+
+    args = _build_parser().parse_args()
+
+    if args.command in dispatch:
+        dispatch[args.command]()
+    elif args.command == "infer":
+        _infer_once(args.title, args.description, args.choice, args.top_k)
+    elif args.command == "try":
+        _try_mode(args.title, args.description, args.choice)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(prog="polymarket-geo")
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -31,18 +59,7 @@ def main() -> None:
     try_parser.add_argument("--description", default="")
     try_parser.add_argument("--choice", action="append", default=[])
 
-    args = parser.parse_args()
-
-    if args.command == "serve":
-        _serve()
-    elif args.command == "run":
-        asyncio.run(_run_once())
-    elif args.command == "migrate":
-        asyncio.run(_migrate())
-    elif args.command == "infer":
-        _infer_once(args.title, args.description, args.choice, args.top_k)
-    elif args.command == "try":
-        _try_mode(args.title, args.description, args.choice)
+    return parser
 
 
 def _serve() -> None:
@@ -52,12 +69,15 @@ def _serve() -> None:
     from polymarket_geo.scheduler import start_scheduler
 
     settings = get_settings()
+    # Reload mode only supports a single worker
+    reload = settings.env == "development"
     start_scheduler()
     uvicorn.run(
         "polymarket_geo.api:app",
         host=settings.api.host,
         port=settings.api.port,
-        reload=(settings.env == "development"),
+        workers=1 if reload else settings.api.workers,
+        reload=reload,
         log_level=settings.log_level.lower(),
     )
 
@@ -79,17 +99,18 @@ async def _migrate() -> None:
 
 
 def _infer_once(title: str, description: str, choices: list[str], top_k: int) -> None:
-    from polymarket_geo.infer import LocationInferenceEngine
+    from polymarket_geo.infer import get_engine
 
-    engine = LocationInferenceEngine()
-    out = engine.infer_semantic(title=title, description=description, choices=choices, top_k=top_k)
+    out = get_engine().infer_semantic(
+        title=title, description=description, choices=choices, top_k=top_k
+    )
     print(json.dumps(out.model_dump(), ensure_ascii=True, indent=2))
 
 
 def _try_mode(initial_title: str | None, description: str, choices: list[str]) -> None:
-    from polymarket_geo.infer import LocationInferenceEngine
+    from polymarket_geo.infer import get_engine
 
-    engine = LocationInferenceEngine()
+    engine = get_engine()
 
     def run_once(title: str, desc: str, ch: list[str]) -> None:
         out = engine.infer_semantic(title=title, description=desc, choices=ch)
@@ -116,27 +137,31 @@ def _try_mode(initial_title: str | None, description: str, choices: list[str]) -
 
 
 def _print_cli_result(title: str, out: GeoInferenceOutput) -> None:
-    print("\n" + "-" * 72)
-    print(f"Market: {title}")
-    print(f"Geo type: {out.geo_type}")
-    print(f"Event type: {out.event_type}")
-    print(f"Locations found: {len(out.locations)}")
+    # Collect lines and write once rather than issuing a print per field
+    lines = [
+        "\n" + "-" * 72,
+        f"Market: {title}",
+        f"Geo type: {out.geo_type}",
+        f"Event type: {out.event_type}",
+        f"Locations found: {len(out.locations)}",
+    ]
 
     if not out.locations:
-        print("(none)")
-        return
+        lines.append("(none)")
 
     for i, loc in enumerate(out.locations, 1):
-        print(f"\n{i}. {loc.name}")
-        print(f"   Confidence:  {loc.confidence:.0%}")
-        print(f"   Granularity: {loc.granularity}")
-        print(f"   Coords:      {loc.lat:.4f}, {loc.lon:.4f}")
-        print(f"   Place ID:    {loc.place_id}")
+        lines.append(f"\n{i}. {loc.name}")
+        lines.append(f"   Confidence:  {loc.confidence:.0%}")
+        lines.append(f"   Granularity: {loc.granularity}")
+        lines.append(f"   Coords:      {loc.lat:.4f}, {loc.lon:.4f}")
+        lines.append(f"   Place ID:    {loc.place_id}")
         if loc.evidence:
             best = sorted(loc.evidence, key=lambda e: e.score, reverse=True)[:2]
-            print("   Evidence:")
+            lines.append("   Evidence:")
             for ev in best:
-                print(f"   - {ev.field}: {ev.snippet[:80]} (score={ev.score:.2f})")
+                lines.append(f"   - {ev.field}: {ev.snippet[:80]} (score={ev.score:.2f})")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,17 +5,21 @@ Endpoints:
   GET /nearby       - Markets within radius km of a lat/lon point
   GET /search       - Search by city/country string
   GET /market/{id}  - Single market with all inferred locations
+                      (also /market/id/{id} and /market/condition/{condition_id})
   GET /health       - Pipeline health metrics
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from pydantic import BaseModel
 
 from polymarket_geo.config import get_settings
 from polymarket_geo.db import (
@@ -28,7 +32,7 @@ from polymarket_geo.db import (
     query_nearby_markets,
     run_migrations,
 )
-from polymarket_geo.geocode import geocode_location
+from polymarket_geo.geocode import close_http_client, fetch_geocode, lookup_cached_geocode
 from polymarket_geo.models import (
     HealthResponse,
     MarketLocationResponse,
@@ -44,14 +48,29 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Startup: create DB pool + run migrations. Shutdown: close pool."""
+    """
+    Startup: create DB pool + run migrations + start the metrics refresher.
+    Shutdown: stop the refresher, close pool and HTTP client.
+    """
     logger.info("Starting up API server...")
+    if not 0 < _DEFAULT_RADIUS_KM <= _MAX_RADIUS_KM:
+        raise ValueError(
+            f"API_DEFAULT_RADIUS_KM ({_DEFAULT_RADIUS_KM}) must be > 0 and "
+            f"<= API_MAX_RADIUS_KM ({_MAX_RADIUS_KM})"
+        )
     await get_pool()
     try:
         await run_migrations()
     except Exception as e:
         logger.warning("Migration failed (may already exist): %s", e)
+    refresher = asyncio.create_task(_refresh_metrics_loop())
     yield
+    refresher.cancel()
+    try:
+        await refresher
+    except asyncio.CancelledError:
+        pass
+    await close_http_client()
     await close_pool()
     logger.info("API server shut down.")
 
@@ -65,40 +84,61 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Bound once at import; read by request handlers on the hot path
+_API_SETTINGS = get_settings().api
+_DEFAULT_RADIUS_KM = _API_SETTINGS.default_radius_km
+_MAX_RADIUS_KM = _API_SETTINGS.max_radius_km
+
+# Read-only API: fixed method/header lists, and browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # tighten in production
+    allow_origins=list(_API_SETTINGS.cors_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
-def _format_market(row: dict) -> MarketResponse:
-    """Convert a DB row dict into a MarketResponse."""
-    locations = []
-    if "locations" in row:
-        for loc in row["locations"]:
-            locations.append(MarketLocationResponse(
-                location_name=loc["location_name"],
-                location_type=loc["location_type"],
-                confidence=loc["confidence"],
-                reason=loc.get("reason"),
-                latitude=loc.get("latitude"),
-                longitude=loc.get("longitude"),
-                inference_method=loc.get("inference_method", "unknown"),
-            ))
-
-    return MarketResponse(
+def _as_float(value) -> float | None:
+    """NUMERIC columns arrive as Decimal; model_construct won't coerce them."""
+    return float(value) if value is not None else None
+
+
+def _format_location(loc: dict) -> MarketLocationResponse:
+    """Build a MarketLocationResponse from a location row (or joined market+location row)."""
+    return MarketLocationResponse.model_construct(
+        location_name=loc["location_name"],
+        location_type=loc["location_type"],
+        confidence=loc["confidence"],
+        reason=loc.get("reason"),
+        latitude=loc.get("latitude"),
+        longitude=loc.get("longitude"),
+        inference_method=loc.get("inference_method", "unknown"),
+    )
+
+
+def _format_market(
+    row: dict, locations: list[MarketLocationResponse] | None = None
+) -> MarketResponse:
+    """
+    Convert a DB row dict into a MarketResponse.
+    Rows come from our own schema, so models are built with model_construct
+    to skip per-field validation.
+    """
+    if locations is None:
+        locations = [_format_location(loc) for loc in row.get("locations", ())]
+
+    return MarketResponse.model_construct(
         id=row["id"],
         condition_id=row["condition_id"],
         question=row["question"],
         description=row.get("description"),
         category=row.get("category"),
         active=row.get("active", True),
-        volume=row.get("volume"),
+        volume=_as_float(row.get("volume")),
         locations=locations,
     )
 
@@ -106,36 +146,90 @@ def _format_market(row: dict) -> MarketResponse:
 def _group_rows_to_markets(rows: list[dict]) -> list[MarketResponse]:
     """
     Group joined market+location rows into MarketResponse objects.
-    Multiple rows per market (one per location) get merged.
+    Multiple rows per market (one per location) get merged in a single pass.
     """
-    markets_map: dict[int, dict] = {}
+    if not rows:
+        return []
+
+    markets_map: dict[int, MarketResponse] = {}
 
     for row in rows:
-        mid = row["id"]
-        if mid not in markets_map:
-            markets_map[mid] = {
-                "id": mid,
-                "condition_id": row["condition_id"],
-                "question": row["question"],
-                "description": row.get("description"),
-                "category": row.get("category"),
-                "active": row.get("active", True),
-                "volume": row.get("volume"),
-                "locations": [],
-            }
+        market = markets_map.get(row["id"])
+        if market is None:
+            market = markets_map[row["id"]] = _format_market(row, locations=[])
 
         if row.get("location_id"):
-            markets_map[mid]["locations"].append({
-                "location_name": row["location_name"],
-                "location_type": row["location_type"],
-                "confidence": row["confidence"],
-                "reason": row.get("reason"),
-                "latitude": row.get("latitude"),
-                "longitude": row.get("longitude"),
-                "inference_method": row.get("inference_method", "unknown"),
-            })
+            market.locations.append(_format_location(row))
+
+    return list(markets_map.values())
+
+
+def _discard_task(task: asyncio.Task | None) -> None:
+    """
+    Drop a speculative task. One that already failed has its exception
+    retrieved, so asyncio doesn't log it as never retrieved.
+    """
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _json_response(payload: BaseModel) -> Response:
+    """
+    Serialize an already-built response model straight to JSON bytes.
+    Returning a Response skips FastAPI's dump + re-validate pass against
+    response_model, which still documents the schema.
+    """
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
+# ── Metrics Snapshot ──────────────────────────────────────────────────
+
+# Aggregates scan whole tables, so scrapes read a snapshot refreshed in the background
+# (ts is None until the first refresh completes)
+_metrics_cache: dict = {"ts": None, "data": {}}
+# At most one aggregate query in flight; concurrent callers await the same task
+_metrics_refresh: asyncio.Task | None = None
+
+
+async def _compute_metrics() -> dict:
+    data = await get_pipeline_metrics()
+    _metrics_cache["data"] = data
+    _metrics_cache["ts"] = time.monotonic()
+    return data
+
 
-    return [_format_market(m) for m in markets_map.values()]
+async def _refresh_metrics() -> dict:
+    """Recompute the snapshot, joining a refresh that is already running."""
+    global _metrics_refresh
+    if _metrics_refresh is None or _metrics_refresh.done():
+        _metrics_refresh = asyncio.create_task(_compute_metrics())
+    # Shielded so a disconnecting client doesn't cancel the shared refresh
+    return await asyncio.shield(_metrics_refresh)
+
+
+async def _refresh_metrics_loop() -> None:
+    while True:
+        try:
+            await _refresh_metrics()
+        except Exception as e:
+            logger.warning("Metrics refresh failed: %s", e)
+        await asyncio.sleep(_API_SETTINGS.metrics_refresh_seconds)
+
+
+async def _get_metrics() -> dict:
+    """
+    Cached metrics; recomputed inline if there is no snapshot yet or the
+    refresher has fallen behind.
+    """
+    ts = _metrics_cache["ts"]
+    max_age = 3 * _API_SETTINGS.metrics_refresh_seconds
+    if ts is None or time.monotonic() - ts > max_age:
+        return await _refresh_metrics()
+    return _metrics_cache["data"]
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -166,11 +260,10 @@ async def nearby_markets(
     LIMIT :limit OFFSET :offset;
     ```
     """
-    settings = get_settings().api
     if radius_km is None:
-        radius_km = settings.default_radius_km
-    if radius_km > settings.max_radius_km:
-        raise HTTPException(400, f"radius_km must be <= {settings.max_radius_km}")
+        radius_km = _DEFAULT_RADIUS_KM
+    if radius_km > _MAX_RADIUS_KM:
+        raise HTTPException(400, f"radius_km must be <= {_MAX_RADIUS_KM}")
 
     rows, total = await query_nearby_markets(
         lat=lat, lon=lon, radius_km=radius_km,
@@ -179,13 +272,13 @@ async def nearby_markets(
 
     markets = _group_rows_to_markets(rows)
 
-    return NearbyResponse(
+    return _json_response(NearbyResponse.model_construct(
         markets=markets,
         total=total,
         center_lat=lat,
         center_lon=lon,
         radius_km=radius_km,
-    )
+    ))
 
 
 @app.get("/search", response_model=SearchResponse)
@@ -200,25 +293,45 @@ async def search_markets(
 
     Strategy:
       1. Text search: ILIKE on question and location_name (trigram-indexed)
-      2. If geocode=True, also geocode the query and do a spatial search
+      2. If geocode=True, look the query up in the geocode cache (concurrently
+         with 1); if text hits don't fill the page, geocode it on a cache miss
+         and do a spatial search
       3. Merge and deduplicate results
 
     This allows searching "Atlanta" to find both:
       - Markets mentioning "Atlanta" in text
       - Markets geocoded near Atlanta's coordinates
     """
-    # Text search
-    rows, total = await query_markets_by_text(q, limit=limit, offset=offset)
+    # Only the cache lookup runs alongside the text query. The provider (rate
+    # limited, and not stoppable once a request is in flight) is called only
+    # if text hits leave room on the page.
+    cache_task = asyncio.create_task(lookup_cached_geocode(q)) if geocode else None
+    try:
+        rows, total = await query_markets_by_text(q, limit=limit, offset=offset)
+    except BaseException:
+        _discard_task(cache_task)
+        raise
     markets = _group_rows_to_markets(rows)
 
+    geo_result = None
+    if cache_task is not None:
+        if len(markets) >= limit:
+            _discard_task(cache_task)
+        else:
+            try:
+                geo_result = await cache_task
+                if geo_result is None:
+                    geo_result = await fetch_geocode(q)
+            except Exception as e:
+                logger.warning("Search geocoding failed for '%s': %s", q, e)
+
     resolved_location = None
     resolved_lat = None
     resolved_lon = None
 
-    # Optionally geocode the search term and do a spatial search too
-    if geocode and len(markets) < limit:
+    # Spatial search around the geocoded point (needs the geocode result)
+    if geo_result is not None:
         try:
-            geo_result = await geocode_location(q)
             if geo_result.latitude and geo_result.longitude:
                 resolved_location = geo_result.display_name
                 resolved_lat = geo_result.latitude
@@ -254,31 +367,41 @@ async def search_markets(
     )
 
 
+@app.get("/market/id/{market_id}", response_model=MarketResponse)
+async def get_market_by_numeric(market_id: int):
+    """Get a single market by numeric DB id."""
+    result = await get_market_by_id(market_id)
+    if result is None:
+        raise HTTPException(404, "Market not found")
+    return _format_market(result)
+
+
+@app.get("/market/condition/{condition_id}", response_model=MarketResponse)
+async def get_market_by_condition(condition_id: str):
+    """Get a single market by Polymarket condition_id."""
+    result = await get_market_by_condition_id(condition_id)
+    if result is None:
+        raise HTTPException(404, "Market not found")
+    return _format_market(result)
+
+
 @app.get("/market/{market_id}", response_model=MarketResponse)
-async def get_market(market_id: int | str):
+async def get_market(market_id: str):
     """
     Get a single market with all its inferred locations.
     Accepts numeric DB id or Polymarket condition_id string.
     """
-    try:
-        # Try as numeric ID first
-        numeric_id = int(market_id)
-        result = await get_market_by_id(numeric_id)
-    except (ValueError, TypeError):
-        # Try as condition_id
-        result = await get_market_by_condition_id(str(market_id))
-
-    if result is None:
-        raise HTTPException(404, "Market not found")
-
-    return _format_market(result)
+    # isdigit() also accepts e.g. "²", which int() rejects
+    if market_id.isascii() and market_id.isdecimal():
+        return await get_market_by_numeric(int(market_id))
+    return await get_market_by_condition(market_id)
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Pipeline and data health metrics."""
     try:
-        metrics = await get_pipeline_metrics()
+        metrics = await _get_metrics()
         total = metrics.get("total_markets", 0)
         with_locs = metrics.get("markets_with_locations", 0)
         pct = round(100.0 * with_locs / total, 1) if total > 0 else 0.0
@@ -298,5 +421,5 @@ async def health_check():
 @app.get("/metrics")
 async def detailed_metrics():
     """Detailed pipeline metrics for monitoring dashboards."""
-    metrics = await get_pipeline_metrics()
+    metrics = await _get_metrics()
     return metrics
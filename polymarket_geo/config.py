@@ -7,7 +7,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from functools import lru_cache
+
+# Read once here because it also picks the idle-connection lifetime default
+_PG_POOL_PREWARM = os.getenv("PG_POOL_PREWARM", "false").lower() == "true"
 
 
 @dataclass(frozen=True)
@@ -19,6 +21,25 @@ class DatabaseConfig:
     database: str = os.getenv("PG_DATABASE", "polymarket_geo")
     min_pool_size: int = int(os.getenv("PG_POOL_MIN", "2"))
     max_pool_size: int = int(os.getenv("PG_POOL_MAX", "10"))
+    # Open max_pool_size connections up front (long-lived API processes)
+    prewarm_pool: bool = _PG_POOL_PREWARM
+    # Recycle a connection after this many queries
+    max_queries: int = int(os.getenv("PG_POOL_MAX_QUERIES", "50000"))
+    # Per-connection prepared statement cache; PostGIS query text is long,
+    # so raise the cacheable size limit or those plans get re-prepared.
+    # Set the size to 0 behind pgbouncer in transaction pooling mode.
+    statement_cache_size: int = int(os.getenv("PG_STATEMENT_CACHE_SIZE", "1024"))
+    max_cacheable_statement_size: int = int(os.getenv("PG_MAX_CACHEABLE_STATEMENT_SIZE", "32768"))
+    # Seconds a cached statement lives; 0 keeps it for the connection's lifetime
+    max_cached_statement_lifetime: int = int(os.getenv("PG_STATEMENT_CACHE_LIFETIME", "0"))
+    # Seconds before an idle connection is closed; defaults to 0 (never) when
+    # prewarming, or the pool would shrink back to min_pool_size after 5 minutes
+    max_inactive_connection_lifetime: float = float(
+        os.getenv("PG_MAX_INACTIVE_CONN_LIFETIME", "0" if _PG_POOL_PREWARM else "300")
+    )
+    command_timeout: float = float(os.getenv("PG_COMMAND_TIMEOUT", "30"))
+    # JIT tends to cost more than it saves on small spatial result sets
+    jit: bool = os.getenv("PG_JIT", "false").lower() == "true"
 
     @property
     def dsn(self) -> str:
@@ -50,8 +71,12 @@ class GeocodingConfig:
     rate_limit_rps: float = float(os.getenv("GEOCODER_RATE_LIMIT", "1.0"))  # Nominatim wants <=1/s
     max_retries: int = int(os.getenv("GEOCODER_MAX_RETRIES", "3"))
     backoff_base: float = float(os.getenv("GEOCODER_BACKOFF_BASE", "2.0"))
+    # Locations geocoded concurrently; the rate limiter still caps provider calls
+    concurrency: int = int(os.getenv("GEOCODER_CONCURRENCY", "8"))
     # Cache TTL in days
     cache_ttl_days: int = int(os.getenv("GEOCODER_CACHE_TTL_DAYS", "30"))
+    # In-process LRU in front of the DB cache (0 disables)
+    memory_cache_size: int = int(os.getenv("GEOCODER_MEMORY_CACHE_SIZE", "4096"))
 
 
 @dataclass(frozen=True)
@@ -82,10 +107,19 @@ class SchedulerConfig:
 class APIConfig:
     host: str = os.getenv("API_HOST", "0.0.0.0")
     port: int = int(os.getenv("API_PORT", "8000"))
+    # uvicorn worker processes; each one opens its own DB pool (PG_POOL_MAX per worker),
+    # so total connections are workers * PG_POOL_MAX. Raise deliberately.
+    workers: int = int(os.getenv("API_WORKERS", "1"))
     # Default radius for /nearby queries in km
     default_radius_km: float = float(os.getenv("API_DEFAULT_RADIUS_KM", "50.0"))
     max_radius_km: float = float(os.getenv("API_MAX_RADIUS_KM", "500.0"))
     max_results: int = int(os.getenv("API_MAX_RESULTS", "100"))
+    # How often /health and /metrics aggregates are recomputed in the background
+    metrics_refresh_seconds: float = float(os.getenv("API_METRICS_REFRESH_SEC", "30"))
+    # Comma-separated allowed origins; "*" allows any
+    cors_origins: tuple[str, ...] = tuple(
+        o.strip() for o in os.getenv("API_CORS_ORIGINS", "*").split(",") if o.strip()
+    )
 
 
 @dataclass(frozen=True)
@@ -100,7 +134,10 @@ class Settings:
     env: str = os.getenv("APP_ENV", "development")
 
 
-@lru_cache(maxsize=1)
+# Built once at import; env vars are read when the dataclasses are defined anyway
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
     """Singleton settings instance."""
-    return Settings()
+    return SETTINGS
@@ -2,14 +2,20 @@
 Database connection management and query functions.
 Uses asyncpg for async Postgres access with connection pooling.
 All spatial queries use PostGIS functions.
+List-returning read helpers hand back asyncpg.Record rows (row["col"] /
+row.get("col")) rather than copying each one into a dict.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional
+from pathlib import Path
+from typing import Any, Optional
 
 import asyncpg
 
@@ -23,23 +29,45 @@ logger = logging.getLogger(__name__)
 _pool: Optional[asyncpg.Pool] = None
 
 
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Per-connection setup: exchange json/jsonb values as Python objects."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename, encoder=json.dumps, decoder=json.loads, schema="pg_catalog",
+        )
+
+
 async def get_pool() -> asyncpg.Pool:
     global _pool
     if _pool is None:
         settings = get_settings()
+        # Prewarming opens every connection now so no request pays connect + auth
+        min_size = (
+            settings.db.max_pool_size if settings.db.prewarm_pool else settings.db.min_pool_size
+        )
         _pool = await asyncpg.create_pool(
             dsn=settings.db.dsn,
-            min_size=settings.db.min_pool_size,
+            min_size=min_size,
             max_size=settings.db.max_pool_size,
+            max_queries=settings.db.max_queries,
+            statement_cache_size=settings.db.statement_cache_size,
+            max_cacheable_statement_size=settings.db.max_cacheable_statement_size,
+            max_cached_statement_lifetime=settings.db.max_cached_statement_lifetime,
+            max_inactive_connection_lifetime=settings.db.max_inactive_connection_lifetime,
+            command_timeout=settings.db.command_timeout,
+            server_settings={"jit": "on" if settings.db.jit else "off"},
+            init=_init_connection,
         )
-        logger.info("Database connection pool created (min=%d, max=%d)",
-                     settings.db.min_pool_size, settings.db.max_pool_size)
+        logger.info("Database connection pool created (min=%d, max=%d, open=%d)",
+                     min_size, settings.db.max_pool_size, _pool.get_size())
+        _start_hit_flusher()
     return _pool
 
 
 async def close_pool() -> None:
     global _pool
     if _pool is not None:
+        await _stop_hit_flusher()
         await _pool.close()
         _pool = None
         logger.info("Database connection pool closed")
@@ -54,49 +82,83 @@ async def get_connection() -> AsyncIterator[asyncpg.Connection]:
 
 # ── Schema Initialization ─────────────────────────────────────────────
 
-async def run_migrations() -> None:
-    """Execute SQL migrations in order (idempotent)."""
-    from pathlib import Path
+_MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+
+def _migration_version(path: Path) -> int:
+    """Version is the numeric filename prefix, e.g. 002_event_venue_cache.sql -> 2."""
+    return int(path.name.split("_", 1)[0])
+
+
+SCHEMA_VERSION = max(
+    (_migration_version(p) for p in _MIGRATIONS_DIR.glob("*.sql")), default=0
+)
+
 
-    migrations_dir = Path(__file__).parent / "migrations"
-    migration_paths = sorted(migrations_dir.glob("*.sql"))
+# Held for the migration transaction so concurrent API workers apply a
+# pending set once; the others wait, then see it already recorded
+_MIGRATION_LOCK_KEY = 7_310_482_001
 
+
+async def run_migrations() -> None:
+    """
+    Execute pending SQL migrations in order, atomically.
+    Applied versions are recorded in schema_migrations, so once the database
+    is at SCHEMA_VERSION this is a single catalog lookup instead of
+    re-running every CREATE ... IF NOT EXISTS.
+    """
     async with get_connection() as conn:
-        for path in migration_paths:
-            sql = path.read_text()
-            await conn.execute(sql)
+        # Fast path without the lock: nothing to do on an up-to-date database
+        if await conn.fetchval("SELECT to_regclass('schema_migrations') IS NOT NULL"):
+            current = await conn.fetchval(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+            )
+            if current >= SCHEMA_VERSION:
+                logger.info("Schema up to date (version %d)", current)
+                return
+
+        async with conn.transaction():
+            await conn.execute("SELECT pg_advisory_xact_lock($1)", _MIGRATION_LOCK_KEY)
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version     INTEGER PRIMARY KEY,
+                    applied_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                )
+                """
+            )
+            # Re-read under the lock: another worker may have just applied them
+            current = await conn.fetchval(
+                "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+            )
+            pending = sorted(
+                (p for p in _MIGRATIONS_DIR.glob("*.sql") if _migration_version(p) > current),
+                key=_migration_version,
+            )
+            if not pending:
+                logger.info("Schema up to date (version %d)", current)
+                return
+
+            # All pending files plus their version rows go to the server as
+            # one script: a single round trip, and no half-applied migration
+            # set if any statement fails
+            versions = ", ".join(f"({_migration_version(p)})" for p in pending)
+            script = "\n;\n".join(p.read_text() for p in pending)
+            script += (
+                f"\n;\nINSERT INTO schema_migrations (version) VALUES {versions}"
+                " ON CONFLICT DO NOTHING;"
+            )
+            await conn.execute(script)
+        for path in pending:
             logger.info("Applied migration: %s", path.name)
-    logger.info("Migrations applied successfully (%d files)", len(migration_paths))
+    logger.info("Migrations applied successfully (%d files)", len(pending))
 
 
 # ── Market Upserts ────────────────────────────────────────────────────
 
-async def upsert_market(conn: asyncpg.Connection, market: RawMarket, raw_payload: dict) -> int:
-    """
-    Insert or update a market by condition_id.
-    Returns the database id of the market row.
-
-    Upsert strategy: ON CONFLICT (condition_id) DO UPDATE
-    - Always refresh price/volume/active/closed (these change frequently)
-    - Never overwrite question/description (stable after creation)
-    """
-    row = await conn.fetchrow(
-        """
-        INSERT INTO markets (
-            condition_id, question, description, market_slug, category,
-            end_date_iso, active, closed, volume, liquidity,
-            outcomes, outcome_prices, tags, raw_payload
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-        ON CONFLICT (condition_id) DO UPDATE SET
-            active = EXCLUDED.active,
-            closed = EXCLUDED.closed,
-            volume = EXCLUDED.volume,
-            liquidity = EXCLUDED.liquidity,
-            outcome_prices = EXCLUDED.outcome_prices,
-            raw_payload = EXCLUDED.raw_payload,
-            updated_at = NOW()
-        RETURNING id
-        """,
+def _market_record(market: RawMarket, raw_payload: dict) -> tuple:
+    """Column values for one markets row, in INSERT column order (JSON as text)."""
+    return (
         market.condition_id,
         market.question,
         market.description,
@@ -112,31 +174,191 @@ async def upsert_market(conn: asyncpg.Connection, market: RawMarket, raw_payload
         json.dumps(market.tags) if market.tags else None,
         json.dumps(raw_payload),
     )
+
+
+_MARKET_COLUMNS = """
+    condition_id, question, description, market_slug, category,
+    end_date_iso, active, closed, volume, liquidity,
+    outcomes, outcome_prices, tags, raw_payload
+"""
+
+# Source columns arrive as text/float8 (see _market_record) and are cast here;
+# JSON stays pre-encoded text because unnest arrays and COPY staging are text
+_MARKET_SELECT_CASTS = """
+    condition_id, question, description, market_slug, category,
+    end_date_iso::timestamptz, active, closed, volume::numeric, liquidity::numeric,
+    outcomes::jsonb, outcome_prices::jsonb, tags::jsonb, raw_payload::jsonb
+"""
+
+_MARKET_ON_CONFLICT = """
+    ON CONFLICT (condition_id) DO UPDATE SET
+        active = EXCLUDED.active,
+        closed = EXCLUDED.closed,
+        volume = EXCLUDED.volume,
+        liquidity = EXCLUDED.liquidity,
+        outcome_prices = EXCLUDED.outcome_prices,
+        raw_payload = EXCLUDED.raw_payload,
+        updated_at = NOW()
+    RETURNING id, (xmax = 0) AS inserted
+"""
+
+_UPSERT_MARKET_SQL = f"""
+    INSERT INTO markets ({_MARKET_COLUMNS})
+    SELECT {_MARKET_SELECT_CASTS}
+    FROM (VALUES (
+        $1::text, $2::text, $3::text, $4::text, $5::text,
+        $6::text, $7::bool, $8::bool, $9::float8, $10::float8,
+        $11::text, $12::text, $13::text, $14::text
+    )) AS t({_MARKET_COLUMNS})
+    {_MARKET_ON_CONFLICT}
+"""
+
+
+async def upsert_market(conn: asyncpg.Connection, market: RawMarket, raw_payload: dict) -> int:
+    """
+    Insert or update a market by condition_id.
+    Returns the database id of the market row.
+
+    Upsert strategy: ON CONFLICT (condition_id) DO UPDATE
+    - Always refresh price/volume/active/closed (these change frequently)
+    - Never overwrite question/description (stable after creation)
+    """
+    row = await conn.fetchrow(_UPSERT_MARKET_SQL, *_market_record(market, raw_payload))
     return row["id"]
 
 
+_UPSERT_MARKETS_UNNEST_SQL = f"""
+    INSERT INTO markets ({_MARKET_COLUMNS})
+    SELECT {_MARKET_SELECT_CASTS}
+    FROM unnest(
+        $1::text[], $2::text[], $3::text[], $4::text[], $5::text[],
+        $6::text[], $7::bool[], $8::bool[], $9::float8[], $10::float8[],
+        $11::text[], $12::text[], $13::text[], $14::text[]
+    ) AS t({_MARKET_COLUMNS})
+    {_MARKET_ON_CONFLICT}
+"""
+
+_UPSERT_MARKETS_FROM_STAGE_SQL = f"""
+    INSERT INTO markets ({_MARKET_COLUMNS})
+    SELECT {_MARKET_SELECT_CASTS}
+    FROM _stage_markets
+    {_MARKET_ON_CONFLICT}
+"""
+
+# Batches larger than this are COPYed into a staging table instead
+_COPY_UPSERT_THRESHOLD = 200
+
+
+async def _upsert_markets_copy(
+    conn: asyncpg.Connection, records: Iterable[tuple]
+) -> list[asyncpg.Record]:
+    """
+    Bulk path for large backfills: COPY rows into a temp staging table, then
+    merge them with a single INSERT ... SELECT ... ON CONFLICT.
+    """
+    async with conn.transaction():
+        await conn.execute(
+            """
+            CREATE TEMP TABLE _stage_markets (
+                condition_id    TEXT,
+                question        TEXT,
+                description     TEXT,
+                market_slug     TEXT,
+                category        TEXT,
+                end_date_iso    TEXT,
+                active          BOOLEAN,
+                closed          BOOLEAN,
+                volume          DOUBLE PRECISION,
+                liquidity       DOUBLE PRECISION,
+                outcomes        TEXT,
+                outcome_prices  TEXT,
+                tags            TEXT,
+                raw_payload     TEXT
+            ) ON COMMIT DROP
+            """
+        )
+        await conn.copy_records_to_table("_stage_markets", records=records)
+        return await conn.fetch(_UPSERT_MARKETS_FROM_STAGE_SQL)
+
+
 async def upsert_markets_batch(markets: list[tuple[RawMarket, dict]]) -> dict:
     """
     Batch upsert markets. Returns stats dict.
+
+    The whole batch goes in one INSERT ... SELECT FROM unnest(...) statement
+    (or through a COPY staging table for large backfills); xmax = 0 on the
+    returned rows distinguishes fresh inserts from updates.
     """
     stats = {"fetched": len(markets), "new": 0, "updated": 0}
+
+    # ON CONFLICT can't touch the same row twice in one statement: last copy wins
+    records = {m.condition_id: _market_record(m, raw) for m, raw in markets}
+    if not records:
+        return stats
+
     async with get_connection() as conn:
-        for market, raw in markets:
-            # Check if exists before upsert to count new vs updated
-            existing = await conn.fetchval(
-                "SELECT id FROM markets WHERE condition_id = $1",
-                market.condition_id,
-            )
-            market_id = await upsert_market(conn, market, raw)
-            if existing is None:
-                stats["new"] += 1
-            else:
-                stats["updated"] += 1
+        if len(records) > _COPY_UPSERT_THRESHOLD:
+            rows = await _upsert_markets_copy(conn, records.values())
+        else:
+            columns = [list(col) for col in zip(*records.values())]
+            rows = await conn.fetch(_UPSERT_MARKETS_UNNEST_SQL, *columns)
+
+    for row in rows:
+        if row["inserted"]:
+            stats["new"] += 1
+        else:
+            stats["updated"] += 1
     return stats
 
 
 # ── Location Upserts ─────────────────────────────────────────────────
 
+_UPSERT_LOCATION_SQL = """
+    INSERT INTO market_locations (
+        market_id, location_name, location_type, confidence, reason,
+        inference_method, latitude, longitude, geog, geocoded,
+        geocode_source, geo_version
+    ) VALUES (
+        $1, $2, $3, $4, $5,
+        $6, $7, $8,
+        CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL
+             THEN ST_SetSRID(ST_MakePoint($8, $7), 4326)::geography
+             ELSE NULL END,
+        CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL THEN TRUE ELSE FALSE END,
+        $9, $10
+    )
+    ON CONFLICT (market_id, location_name, geo_version) DO UPDATE SET
+        location_type = EXCLUDED.location_type,
+        confidence = EXCLUDED.confidence,
+        reason = EXCLUDED.reason,
+        inference_method = EXCLUDED.inference_method,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        geog = EXCLUDED.geog,
+        geocoded = EXCLUDED.geocoded,
+        geocode_source = EXCLUDED.geocode_source,
+        geocode_raw = EXCLUDED.geocode_raw,
+        updated_at = NOW()
+    RETURNING id
+"""
+
+
+def _location_record(market_id: int, loc: LocationCandidate, geo_version: int) -> tuple:
+    """Positional parameters for _UPSERT_LOCATION_SQL."""
+    return (
+        market_id,
+        loc.location_name,
+        loc.location_type.value,
+        loc.confidence,
+        loc.reason,
+        loc.inference_method.value,
+        loc.latitude,
+        loc.longitude,
+        "cache" if loc.latitude else None,  # will be updated after geocoding
+        geo_version,
+    )
+
+
 async def upsert_location(
     conn: asyncpg.Connection,
     market_id: int,
@@ -149,41 +371,8 @@ async def upsert_location(
     When the same location is inferred again in the same version, we update confidence/reason.
     """
     row = await conn.fetchrow(
-        """
-        INSERT INTO market_locations (
-            market_id, location_name, location_type, confidence, reason,
-            inference_method, latitude, longitude, geog, geocoded,
-            geocode_source, geo_version
-        ) VALUES (
-            $1, $2, $3, $4, $5,
-            $6, $7, $8,
-            CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL
-                 THEN ST_SetSRID(ST_MakePoint($8, $7), 4326)::geography
-                 ELSE NULL END,
-            CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL THEN TRUE ELSE FALSE END,
-            $9, $10
-        )
-        ON CONFLICT (market_id, location_name, geo_version) DO UPDATE SET
-            confidence = EXCLUDED.confidence,
-            reason = EXCLUDED.reason,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            geog = EXCLUDED.geog,
-            geocoded = EXCLUDED.geocoded,
-            geocode_source = EXCLUDED.geocode_source,
-            updated_at = NOW()
-        RETURNING id
-        """,
-        market_id,
-        loc.location_name,
-        loc.location_type.value,
-        loc.confidence,
-        loc.reason,
-        loc.inference_method.value,
-        loc.latitude,
-        loc.longitude,
-        "cache" if loc.latitude else None,  # will be updated after geocoding
-        geo_version,
+        _UPSERT_LOCATION_SQL,
+        *_location_record(market_id, loc, geo_version),
     )
     return row["id"]
 
@@ -195,106 +384,138 @@ async def save_inference_result(
     """
     Save all location candidates for a market and mark it as geo_processed.
     Runs in a transaction so either all locations save or none.
+
+    Locations are upserted, then any row from an earlier run of this version
+    that wasn't re-inferred is deleted, so the result matches a clean
+    re-inference without a blanket DELETE up front.
     """
     async with get_connection() as conn:
         async with conn.transaction():
-            # Get market_id from condition_id
+            # Resolve market_id and mark it processed in one statement
             market_id = await conn.fetchval(
-                "SELECT id FROM markets WHERE condition_id = $1",
-                result.condition_id,
+                """
+                UPDATE markets
+                SET geo_processed = TRUE,
+                    geo_processed_at = NOW(),
+                    geo_version = $2
+                WHERE condition_id = $1
+                RETURNING id
+                """,
+                result.condition_id, geo_version,
             )
             if market_id is None:
                 logger.warning("Market %s not found in DB, skipping location save",
                                result.condition_id)
                 return
 
-            # Delete old locations for this version (clean re-inference)
-            await conn.execute(
-                "DELETE FROM market_locations WHERE market_id = $1 AND geo_version = $2",
-                market_id, geo_version,
-            )
-
-            # Insert new locations
-            for loc in result.locations:
-                await upsert_location(conn, market_id, loc, geo_version)
+            # Upsert new locations (pipelined: one sync for the whole set)
+            if result.locations:
+                await conn.executemany(
+                    _UPSERT_LOCATION_SQL,
+                    [_location_record(market_id, loc, geo_version) for loc in result.locations],
+                )
 
-            # Mark market as processed
+            # Drop locations from a previous run that weren't inferred this time
             await conn.execute(
                 """
-                UPDATE markets
-                SET geo_processed = TRUE,
-                    geo_processed_at = NOW(),
-                    geo_version = $2
-                WHERE id = $1
+                DELETE FROM market_locations
+                WHERE market_id = $1 AND geo_version = $2
+                  AND location_name <> ALL($3::text[])
                 """,
                 market_id, geo_version,
+                [loc.location_name for loc in result.locations],
             )
 
 
-async def update_location_geocode(
-    location_id: int,
-    latitude: float,
-    longitude: float,
-    source: str,
-    raw_response: Optional[dict] = None,
+async def update_location_geocodes(
+    updates: list[tuple[int, float, float, str, dict | None]],
 ) -> None:
-    """Update a location row with geocoded coordinates."""
-    async with get_connection() as conn:
-        await conn.execute(
-            """
-            UPDATE market_locations
-            SET latitude = $2,
-                longitude = $3,
-                geog = ST_SetSRID(ST_MakePoint($3, $2), 4326)::geography,
-                geocoded = TRUE,
-                geocode_source = $4,
-                geocode_raw = $5,
-                updated_at = NOW()
-            WHERE id = $1
-            """,
-            location_id, latitude, longitude, source,
-            json.dumps(raw_response) if raw_response else None,
-        )
+    """
+    Update location rows with geocoded coordinates in one UPDATE ... FROM
+    unnest over (location_id, latitude, longitude, source, raw_response) tuples.
+    """
+    if not updates:
+        return
+    ids, lats, lons, sources, raws = zip(*updates)
+    pool = await get_pool()
+    await pool.execute(
+        """
+        UPDATE market_locations ml
+        SET latitude = t.latitude,
+            longitude = t.longitude,
+            geog = ST_SetSRID(ST_MakePoint(t.longitude, t.latitude), 4326)::geography,
+            geocoded = TRUE,
+            geocode_source = t.source,
+            geocode_raw = t.raw::jsonb,
+            updated_at = NOW()
+        FROM unnest($1::bigint[], $2::float8[], $3::float8[], $4::text[], $5::text[])
+            AS t(id, latitude, longitude, source, raw)
+        WHERE ml.id = t.id
+        """,
+        list(ids), list(lats), list(lons), list(sources),
+        [json.dumps(r) if r else None for r in raws],
+    )
 
 
 # ── Fetch Unprocessed Markets ────────────────────────────────────────
 
-async def get_unprocessed_markets(
+# The two cases (never processed / processed at an older version) are
+# disjoint, so each is read from its own partial index (migration 004) and only
+# the two short branches get merged. The never-processed branch is walked in
+# created_at order; the stale branch uses its index for the geo_version range
+# and sorts just the stale rows, so it costs nothing when none are stale.
+_UNPROCESSED_MARKETS_SQL = """
+    (
+        SELECT id, condition_id, question, description, category, tags, created_at
+        FROM markets
+        WHERE geo_processed = FALSE
+        ORDER BY created_at DESC
+        LIMIT $2
+    )
+    UNION ALL
+    (
+        SELECT id, condition_id, question, description, category, tags, created_at
+        FROM markets
+        WHERE geo_processed = TRUE AND geo_version < $1
+        ORDER BY created_at DESC
+        LIMIT $2
+    )
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
+
+
+async def iter_unprocessed_markets(
     geo_version: int,
     limit: int = 500,
-) -> list[dict]:
+    chunk_size: int = 100,
+) -> AsyncIterator[list[asyncpg.Record]]:
     """
-    Fetch markets that haven't been processed at the current geo_version.
-    This enables re-processing when inference logic changes.
+    Stream markets that haven't been processed at the current geo_version
+    (so inference changes get re-processed) from a server-side cursor, in
+    chunks so large backfills never hold the whole set in memory.
     """
     async with get_connection() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT id, condition_id, question, description, category, tags
-            FROM markets
-            WHERE geo_processed = FALSE OR geo_version < $1
-            ORDER BY created_at DESC
-            LIMIT $2
-            """,
-            geo_version, limit,
-        )
-        return [dict(r) for r in rows]
+        async with conn.transaction():
+            cursor = await conn.cursor(_UNPROCESSED_MARKETS_SQL, geo_version, limit)
+            while chunk := await cursor.fetch(chunk_size):
+                yield chunk
 
 
-async def get_ungeooded_locations(limit: int = 500) -> list[dict]:
+async def get_ungeooded_locations(limit: int = 500) -> list[asyncpg.Record]:
     """Fetch location candidates that need geocoding."""
-    async with get_connection() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT id, location_name, location_type
-            FROM market_locations
-            WHERE geocoded = FALSE AND location_type != 'global'
-            ORDER BY confidence DESC
-            LIMIT $1
-            """,
-            limit,
-        )
-        return [dict(r) for r in rows]
+    pool = await get_pool()
+    rows = await pool.fetch(
+        """
+        SELECT id, location_name, location_type
+        FROM market_locations
+        WHERE geocoded = FALSE AND location_type != 'global'
+        ORDER BY confidence DESC
+        LIMIT $1
+        """,
+        limit,
+    )
+    return rows
 
 
 # ── Spatial Queries (used by API) ─────────────────────────────────────
@@ -306,208 +527,356 @@ async def query_nearby_markets(
     min_confidence: float = 0.0,
     limit: int = 100,
     offset: int = 0,
-) -> tuple[list[dict], int]:
+) -> tuple[list[asyncpg.Record], int]:
     """
     Find markets within radius_km of a lat/lon point.
     Uses ST_DWithin for indexed spatial filtering.
     Returns (rows, total_count).
+
+    The page and the distinct-market total come back from one query: the
+    spatial filter runs once into a CTE that both the page and the count read,
+    and the reference point is built once in its own CTE.
     """
     radius_meters = radius_km * 1000
 
     async with get_connection() as conn:
-        # Count total matches
-        total = await conn.fetchval(
-            """
-            SELECT COUNT(DISTINCT m.id)
-            FROM markets m
-            JOIN market_locations ml ON ml.market_id = m.id
-            WHERE ml.geocoded = TRUE
-              AND ml.confidence >= $3
-              AND ST_DWithin(
-                  ml.geog,
-                  ST_SetSRID(ST_MakePoint($2, $1), 4326)::geography,
-                  $4
-              )
-            """,
-            lat, lon, min_confidence, radius_meters,
-        )
-
-        # Fetch paginated results, ordered by distance then confidence
         rows = await conn.fetch(
             """
-            SELECT
-                m.id,
-                m.condition_id,
-                m.question,
-                m.description,
-                m.category,
-                m.active,
-                m.volume,
-                ml.id AS location_id,
-                ml.location_name,
-                ml.location_type,
-                ml.confidence,
-                ml.reason,
-                ml.latitude,
-                ml.longitude,
-                ml.inference_method,
-                ST_Distance(
-                    ml.geog,
-                    ST_SetSRID(ST_MakePoint($2, $1), 4326)::geography
-                ) AS distance_meters
-            FROM markets m
-            JOIN market_locations ml ON ml.market_id = m.id
-            WHERE ml.geocoded = TRUE
-              AND ml.confidence >= $3
-              AND ST_DWithin(
-                  ml.geog,
-                  ST_SetSRID(ST_MakePoint($2, $1), 4326)::geography,
-                  $4
-              )
-            ORDER BY distance_meters ASC, ml.confidence DESC
+            WITH ref AS (
+                SELECT ST_SetSRID(ST_MakePoint($2, $1), 4326)::geography AS geog
+            ),
+            hits AS (
+                SELECT
+                    m.id,
+                    m.condition_id,
+                    m.question,
+                    m.description,
+                    m.category,
+                    m.active,
+                    m.volume,
+                    ml.id AS location_id,
+                    ml.location_name,
+                    ml.location_type,
+                    ml.confidence,
+                    ml.reason,
+                    ml.latitude,
+                    ml.longitude,
+                    ml.inference_method,
+                    ST_Distance(ml.geog, ref.geog) AS distance_meters
+                FROM ref
+                JOIN market_locations ml ON ST_DWithin(ml.geog, ref.geog, $4)
+                JOIN markets m ON m.id = ml.market_id
+                WHERE ml.geocoded = TRUE
+                  AND ml.confidence >= $3
+            )
+            SELECT hits.*, (SELECT COUNT(DISTINCT id) FROM hits) AS total_count
+            FROM hits
+            ORDER BY distance_meters ASC, confidence DESC
             LIMIT $5 OFFSET $6
             """,
             lat, lon, min_confidence, radius_meters, limit, offset,
         )
 
-        return [dict(r) for r in rows], total
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset > 0:
+            # Paged past the end, so no row carries the total; count separately
+            total = await conn.fetchval(
+                """
+                WITH ref AS (
+                    SELECT ST_SetSRID(ST_MakePoint($2, $1), 4326)::geography AS geog
+                )
+                SELECT COUNT(DISTINCT ml.market_id)
+                FROM ref
+                JOIN market_locations ml ON ST_DWithin(ml.geog, ref.geog, $4)
+                WHERE ml.geocoded = TRUE
+                  AND ml.confidence >= $3
+                """,
+                lat, lon, min_confidence, radius_meters,
+            )
+        else:
+            total = 0
+
+        return rows, total
+
+
+# Matching market ids, one indexable branch per GIN index: an OR across the
+# join can't use them all, a UNION of the lookups can. $1 is the ILIKE
+# pattern, $2 the raw query for full-text matching.
+_TEXT_MATCH_CTE = """
+    matched AS (
+        SELECT id FROM markets WHERE question ILIKE $1
+        UNION
+        SELECT id FROM markets WHERE tsv @@ websearch_to_tsquery('english', $2)
+        UNION
+        SELECT market_id FROM market_locations WHERE location_name ILIKE $1
+    )
+"""
 
 
 async def query_markets_by_text(
     query: str,
     limit: int = 100,
     offset: int = 0,
-) -> tuple[list[dict], int]:
+) -> tuple[list[asyncpg.Record], int]:
     """
-    Search markets by location name or question text using trigram similarity.
+    Search markets by location name or question text using trigram similarity,
+    plus full-text matching on question/description (ranked first by ts_rank_cd).
+    Returns (rows, total_count) from a single query, as in query_nearby_markets.
     """
     pattern = f"%{query}%"
 
     async with get_connection() as conn:
-        total = await conn.fetchval(
-            """
-            SELECT COUNT(DISTINCT m.id)
-            FROM markets m
-            LEFT JOIN market_locations ml ON ml.market_id = m.id
-            WHERE m.question ILIKE $1
-               OR ml.location_name ILIKE $1
-            """,
-            pattern,
-        )
-
         rows = await conn.fetch(
-            """
-            SELECT
-                m.id,
-                m.condition_id,
-                m.question,
-                m.description,
-                m.category,
-                m.active,
-                m.volume,
-                ml.id AS location_id,
-                ml.location_name,
-                ml.location_type,
-                ml.confidence,
-                ml.reason,
-                ml.latitude,
-                ml.longitude,
-                ml.inference_method
-            FROM markets m
-            LEFT JOIN market_locations ml ON ml.market_id = m.id
-            WHERE m.question ILIKE $1
-               OR ml.location_name ILIKE $1
-            ORDER BY ml.confidence DESC NULLS LAST
-            LIMIT $2 OFFSET $3
+            f"""
+            WITH {_TEXT_MATCH_CTE},
+            hits AS (
+                SELECT
+                    m.id,
+                    m.condition_id,
+                    m.question,
+                    m.description,
+                    m.category,
+                    m.active,
+                    m.volume,
+                    ml.id AS location_id,
+                    ml.location_name,
+                    ml.location_type,
+                    ml.confidence,
+                    ml.reason,
+                    ml.latitude,
+                    ml.longitude,
+                    ml.inference_method,
+                    ts_rank_cd(m.tsv, websearch_to_tsquery('english', $2)) AS text_rank
+                FROM matched
+                JOIN markets m ON m.id = matched.id
+                LEFT JOIN market_locations ml ON ml.market_id = m.id
+                WHERE m.question ILIKE $1
+                   OR m.tsv @@ websearch_to_tsquery('english', $2)
+                   OR ml.location_name ILIKE $1
+            )
+            SELECT hits.*, (SELECT COUNT(DISTINCT id) FROM hits) AS total_count
+            FROM hits
+            ORDER BY text_rank DESC, confidence DESC NULLS LAST
+            LIMIT $3 OFFSET $4
             """,
-            pattern, limit, offset,
+            pattern, query, limit, offset,
         )
 
-        return [dict(r) for r in rows], total
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset > 0:
+            total = await conn.fetchval(
+                f"WITH {_TEXT_MATCH_CTE} SELECT COUNT(*) FROM matched",
+                pattern, query,
+            )
+        else:
+            total = 0
+
+        return rows, total
+
+
+_MARKET_WITH_LOCATIONS_SQL = """
+    SELECT m.id, m.condition_id, m.question, m.description, m.category,
+           m.active, m.closed, m.volume, m.liquidity, m.outcomes, m.outcome_prices,
+           COALESCE(
+               json_agg(
+                   json_build_object(
+                       'location_name', ml.location_name,
+                       'location_type', ml.location_type,
+                       'confidence', ml.confidence,
+                       'reason', ml.reason,
+                       'latitude', ml.latitude,
+                       'longitude', ml.longitude,
+                       'inference_method', ml.inference_method
+                   ) ORDER BY ml.confidence DESC
+               ) FILTER (WHERE ml.id IS NOT NULL),
+               '[]'::json
+           ) AS locations
+    FROM markets m
+    LEFT JOIN market_locations ml ON ml.market_id = m.id
+    WHERE m.{key} = $1
+    GROUP BY m.id
+"""
 
 
 async def get_market_by_id(market_id: int) -> Optional[dict]:
-    """Fetch a single market with all its location candidates."""
-    async with get_connection() as conn:
-        market = await conn.fetchrow(
-            """
-            SELECT id, condition_id, question, description, category,
-                   active, closed, volume, liquidity, outcomes, outcome_prices
-            FROM markets WHERE id = $1
-            """,
-            market_id,
-        )
-        if market is None:
-            return None
-
-        locations = await conn.fetch(
-            """
-            SELECT location_name, location_type, confidence, reason,
-                   latitude, longitude, inference_method
-            FROM market_locations
-            WHERE market_id = $1
-            ORDER BY confidence DESC
-            """,
-            market_id,
-        )
-
-        result = dict(market)
-        result["locations"] = [dict(r) for r in locations]
-        return result
+    """
+    Fetch a single market with all its location candidates.
+    Locations are aggregated server-side (json_agg), so this is one round trip.
+    """
+    pool = await get_pool()
+    row = await pool.fetchrow(_MARKET_WITH_LOCATIONS_SQL.format(key="id"), market_id)
+    return dict(row) if row else None
 
 
 async def get_market_by_condition_id(condition_id: str) -> Optional[dict]:
-    """Fetch a single market by its Polymarket condition_id."""
-    async with get_connection() as conn:
-        row = await conn.fetchrow(
-            "SELECT id FROM markets WHERE condition_id = $1", condition_id
-        )
-        if row is None:
-            return None
-        return await get_market_by_id(row["id"])
+    """Fetch a single market by its Polymarket condition_id (same single query)."""
+    pool = await get_pool()
+    row = await pool.fetchrow(_MARKET_WITH_LOCATIONS_SQL.format(key="condition_id"), condition_id)
+    return dict(row) if row else None
 
 
 # ── Pipeline Metrics ──────────────────────────────────────────────────
 
 async def get_pipeline_metrics() -> dict:
-    """Fetch aggregate metrics for the pipeline health dashboard."""
-    async with get_connection() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT
-                (SELECT COUNT(*) FROM markets) AS total_markets,
-                (SELECT COUNT(*) FROM markets WHERE geo_processed) AS processed_markets,
-                (SELECT COUNT(DISTINCT market_id) FROM market_locations) AS markets_with_locations,
-                (SELECT ROUND(AVG(confidence)::numeric, 4) FROM market_locations) AS avg_confidence,
-                (SELECT COUNT(*) FROM market_locations WHERE confidence < 0.5) AS low_confidence,
-                (SELECT COUNT(*) FROM geocode_cache) AS cache_entries,
-                (SELECT SUM(hit_count) FROM geocode_cache) AS total_cache_hits
-            """
+    """
+    Fetch aggregate metrics for the pipeline health dashboard.
+    One aggregate pass per table (FILTER clauses) instead of a scan per metric.
+    """
+    pool = await get_pool()
+    row = await pool.fetchrow(
+        """
+        WITH m AS (
+            SELECT COUNT(*) AS total_markets,
+                   COUNT(*) FILTER (WHERE geo_processed) AS processed_markets
+            FROM markets
+        ),
+        l AS (
+            SELECT COUNT(DISTINCT market_id) AS markets_with_locations,
+                   ROUND(AVG(confidence)::numeric, 4) AS avg_confidence,
+                   COUNT(*) FILTER (WHERE confidence < 0.5) AS low_confidence
+            FROM market_locations
+        ),
+        c AS (
+            SELECT COUNT(*) AS cache_entries,
+                   SUM(hit_count) AS total_cache_hits
+            FROM geocode_cache
         )
-        return dict(row) if row else {}
+        SELECT m.total_markets, m.processed_markets,
+               l.markets_with_locations, l.avg_confidence, l.low_confidence,
+               c.cache_entries, c.total_cache_hits
+        FROM m, l, c
+        """
+    )
+    return dict(row) if row else {}
 
 
 # ── Geocode Cache (DB-backed) ────────────────────────────────────────
 
 async def get_cached_geocode(query_normalized: str) -> Optional[dict]:
-    """Look up a geocode result from the persistent cache."""
-    async with get_connection() as conn:
-        row = await conn.fetchrow(
+    """
+    Look up a geocode result from the persistent cache.
+    The hit is counted in memory and written back by the periodic flush.
+    """
+    pool = await get_pool()
+    row = await pool.fetchrow(
+        """
+        SELECT latitude, longitude, display_name, source, expires_at
+        FROM geocode_cache
+        WHERE query_normalized = $1 AND expires_at > NOW()
+        """,
+        query_normalized,
+    )
+    if row is None:
+        return None
+    record_geocode_hits([query_normalized])
+    return dict(row)
+
+
+async def get_cached_geocode_many(queries_normalized: list[str]) -> dict[str, dict]:
+    """Batch form of get_cached_geocode: one round trip, keyed by query_normalized."""
+    if not queries_normalized:
+        return {}
+    pool = await get_pool()
+    rows = await pool.fetch(
+        """
+        SELECT query_normalized, latitude, longitude, display_name, source, expires_at
+        FROM geocode_cache
+        WHERE query_normalized = ANY($1::text[]) AND expires_at > NOW()
+        """,
+        list(queries_normalized),
+    )
+    out = {row["query_normalized"]: dict(row) for row in rows}
+    record_geocode_hits(out.keys())
+    return out
+
+
+# Hit counts are buffered per process and applied in one UPDATE, rather than
+# a row write (and row lock) on geocode_cache for every cache hit. The buffer is
+# flushed every _HIT_FLUSH_INTERVAL_SEC, or early once _HIT_FLUSH_THRESHOLD hits
+# have accumulated, so a burst can't grow it (or the lost-on-crash window) unbounded
+_geocode_hits: Counter[str] = Counter()
+_buffered_hits = 0
+_hit_flusher: asyncio.Task | None = None
+_threshold_flush: asyncio.Task | None = None
+_HIT_FLUSH_INTERVAL_SEC = 10.0
+_HIT_FLUSH_THRESHOLD = 1000
+
+
+def record_geocode_hits(queries_normalized: Iterable[str]) -> None:
+    """Buffer one cache hit per query; schedules an early flush past the threshold."""
+    global _buffered_hits, _threshold_flush
+    for q in queries_normalized:
+        _geocode_hits[q] += 1
+        _buffered_hits += 1
+    if (
+        _buffered_hits >= _HIT_FLUSH_THRESHOLD
+        and _pool is not None
+        and (_threshold_flush is None or _threshold_flush.done())
+    ):
+        _threshold_flush = asyncio.create_task(_flush_geocode_hits_logged())
+
+
+async def flush_geocode_hits() -> None:
+    """Write buffered hit counts to geocode_cache in a single statement."""
+    global _buffered_hits
+    if not _geocode_hits or _pool is None:
+        return
+    pending = dict(_geocode_hits)
+    _geocode_hits.clear()
+    _buffered_hits = 0
+    try:
+        await _pool.execute(
             """
-            SELECT latitude, longitude, display_name, source, raw_response
-            FROM geocode_cache
-            WHERE query_normalized = $1 AND expires_at > NOW()
+            UPDATE geocode_cache g
+            SET hit_count = g.hit_count + t.hits
+            FROM unnest($1::text[], $2::int[]) AS t(query_normalized, hits)
+            WHERE g.query_normalized = t.query_normalized
             """,
-            query_normalized,
+            list(pending), list(pending.values()),
         )
-        if row is not None:
-            # Increment hit counter
-            await conn.execute(
-                "UPDATE geocode_cache SET hit_count = hit_count + 1 WHERE query_normalized = $1",
-                query_normalized,
-            )
-            return dict(row)
-        return None
+    except Exception:
+        # Keep the counts for the next flush
+        _geocode_hits.update(pending)
+        _buffered_hits += sum(pending.values())
+        raise
+
+
+async def _flush_geocode_hits_logged() -> None:
+    try:
+        await flush_geocode_hits()
+    except Exception as e:
+        logger.warning("Geocode hit flush failed: %s", e)
+
+
+async def _flush_geocode_hits_loop() -> None:
+    while True:
+        await asyncio.sleep(_HIT_FLUSH_INTERVAL_SEC)
+        await _flush_geocode_hits_logged()
+
+
+def _start_hit_flusher() -> None:
+    global _hit_flusher
+    if _hit_flusher is None:
+        _hit_flusher = asyncio.create_task(_flush_geocode_hits_loop())
+
+
+async def _stop_hit_flusher() -> None:
+    global _hit_flusher
+    if _hit_flusher is not None:
+        _hit_flusher.cancel()
+        try:
+            await _hit_flusher
+        except asyncio.CancelledError:
+            pass
+        _hit_flusher = None
+    if _threshold_flush is not None:
+        await _threshold_flush
+    try:
+        await flush_geocode_hits()
+    except Exception as e:
+        logger.warning("Final geocode hit flush failed: %s", e)
 
 
 async def set_cached_geocode(
@@ -520,45 +889,45 @@ async def set_cached_geocode(
     ttl_days: int = 30,
 ) -> None:
     """Store a geocode result in the persistent cache."""
-    async with get_connection() as conn:
-        await conn.execute(
-            """
-            INSERT INTO geocode_cache (
-                query_normalized, latitude, longitude, display_name,
-                source, raw_response, expires_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, NOW() + make_interval(days => $7))
-            ON CONFLICT (query_normalized) DO UPDATE SET
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                display_name = EXCLUDED.display_name,
-                raw_response = EXCLUDED.raw_response,
-                fetched_at = NOW(),
-                expires_at = NOW() + make_interval(days => $7)
-            """,
+    pool = await get_pool()
+    await pool.execute(
+        """
+        INSERT INTO geocode_cache (
             query_normalized, latitude, longitude, display_name,
-            source, json.dumps(raw_response) if raw_response else None,
-            ttl_days,
-        )
+            source, raw_response, expires_at
+        ) VALUES ($1, $2, $3, $4, $5, $6, NOW() + make_interval(days => $7))
+        ON CONFLICT (query_normalized) DO UPDATE SET
+            latitude = EXCLUDED.latitude,
+            longitude = EXCLUDED.longitude,
+            display_name = EXCLUDED.display_name,
+            raw_response = EXCLUDED.raw_response,
+            fetched_at = NOW(),
+            expires_at = NOW() + make_interval(days => $7)
+        """,
+        query_normalized, latitude, longitude, display_name,
+        source, raw_response or None,
+        ttl_days,
+    )
 
 
 # ── Event Venue Cache (DB-backed) ─────────────────────────────────────
 
 async def get_cached_event_venue(event_key: str, event_year: Optional[int]) -> Optional[dict]:
     """Look up cached event venue resolution from Postgres cache."""
-    async with get_connection() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT status, venue_name, city, country, latitude, longitude,
-                   source_url, source_type, confidence, reason, raw_payload
-            FROM event_venue_cache
-            WHERE event_key = $1
-              AND event_year IS NOT DISTINCT FROM $2
-              AND expires_at > NOW()
-            """,
-            event_key,
-            event_year,
-        )
-        return dict(row) if row else None
+    pool = await get_pool()
+    row = await pool.fetchrow(
+        """
+        SELECT status, venue_name, city, country, latitude, longitude,
+               source_url, source_type, confidence, reason, raw_payload
+        FROM event_venue_cache
+        WHERE event_key = $1
+          AND event_year IS NOT DISTINCT FROM $2
+          AND expires_at > NOW()
+        """,
+        event_key,
+        event_year,
+    )
+    return dict(row) if row else None
 
 
 async def set_cached_event_venue(
@@ -578,98 +947,98 @@ async def set_cached_event_venue(
     ttl_days: int = 7,
 ) -> None:
     """Upsert event venue cache row in Postgres."""
-    async with get_connection() as conn:
-        await conn.execute(
-            """
-            INSERT INTO event_venue_cache (
-                event_key, event_year, status, venue_name, city, country,
-                latitude, longitude, geog, source_url, source_type,
-                confidence, reason, raw_payload, fetched_at, expires_at
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6,
-                $7, $8,
-                CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL
-                     THEN ST_SetSRID(ST_MakePoint($8, $7), 4326)::geography
-                     ELSE NULL END,
-                $9, $10,
-                $11, $12, $13,
-                NOW(), NOW() + make_interval(days => $14)
-            )
-            ON CONFLICT (event_key, event_year) DO UPDATE SET
-                status = EXCLUDED.status,
-                venue_name = EXCLUDED.venue_name,
-                city = EXCLUDED.city,
-                country = EXCLUDED.country,
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                geog = EXCLUDED.geog,
-                source_url = EXCLUDED.source_url,
-                source_type = EXCLUDED.source_type,
-                confidence = EXCLUDED.confidence,
-                reason = EXCLUDED.reason,
-                raw_payload = EXCLUDED.raw_payload,
-                fetched_at = NOW(),
-                expires_at = NOW() + make_interval(days => $14),
-                updated_at = NOW()
-            """,
-            event_key,
-            event_year,
-            status,
-            venue_name,
-            city,
-            country,
-            latitude,
-            longitude,
-            source_url,
-            source_type,
-            confidence,
-            reason,
-            json.dumps(raw_payload) if raw_payload else None,
-            ttl_days,
+    pool = await get_pool()
+    await pool.execute(
+        """
+        INSERT INTO event_venue_cache (
+            event_key, event_year, status, venue_name, city, country,
+            latitude, longitude, geog, source_url, source_type,
+            confidence, reason, raw_payload, fetched_at, expires_at
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6,
+            $7, $8,
+            CASE WHEN $7 IS NOT NULL AND $8 IS NOT NULL
+                 THEN ST_SetSRID(ST_MakePoint($8, $7), 4326)::geography
+                 ELSE NULL END,
+            $9, $10,
+            $11, $12, $13,
+            NOW(), NOW() + make_interval(days => $14)
         )
+        ON CONFLICT (event_key, event_year) DO UPDATE SET
+            status = EXCLUDED.status,
+            venue_name = EXCLUDED.venue_name,
+            city = EXCLUDED.city,
+            country = EXCLUDED.country,
+            latitude = EXCLUDED.latitude,
+            longitude = EXCLUDED.longitude,
+            geog = EXCLUDED.geog,
+            source_url = EXCLUDED.source_url,
+            source_type = EXCLUDED.source_type,
+            confidence = EXCLUDED.confidence,
+            reason = EXCLUDED.reason,
+            raw_payload = EXCLUDED.raw_payload,
+            fetched_at = NOW(),
+            expires_at = NOW() + make_interval(days => $14),
+            updated_at = NOW()
+        """,
+        event_key,
+        event_year,
+        status,
+        venue_name,
+        city,
+        country,
+        latitude,
+        longitude,
+        source_url,
+        source_type,
+        confidence,
+        reason,
+        raw_payload or None,
+        ttl_days,
+    )
 
 
 # ── Pipeline Run Tracking ─────────────────────────────────────────────
 
 async def start_pipeline_run() -> int:
     """Record the start of a pipeline run. Returns run_id."""
-    async with get_connection() as conn:
-        row = await conn.fetchrow(
-            "INSERT INTO pipeline_runs DEFAULT VALUES RETURNING id"
-        )
-        return row["id"]
+    pool = await get_pool()
+    row = await pool.fetchrow(
+        "INSERT INTO pipeline_runs DEFAULT VALUES RETURNING id"
+    )
+    return row["id"]
 
 
 async def finish_pipeline_run(run_id: int, stats: dict, error: Optional[str] = None) -> None:
     """Record the completion of a pipeline run."""
-    async with get_connection() as conn:
-        await conn.execute(
-            """
-            UPDATE pipeline_runs SET
-                finished_at = NOW(),
-                status = $2,
-                markets_fetched = $3,
-                markets_new = $4,
-                markets_updated = $5,
-                locations_inferred = $6,
-                locations_geocoded = $7,
-                geocode_cache_hits = $8,
-                geocode_cache_misses = $9,
-                avg_confidence = $10,
-                error_message = $11,
-                metadata = $12
-            WHERE id = $1
-            """,
-            run_id,
-            "failed" if error else "completed",
-            stats.get("markets_fetched", 0),
-            stats.get("markets_new", 0),
-            stats.get("markets_updated", 0),
-            stats.get("locations_inferred", 0),
-            stats.get("locations_geocoded", 0),
-            stats.get("geocode_cache_hits", 0),
-            stats.get("geocode_cache_misses", 0),
-            stats.get("avg_confidence"),
-            error,
-            json.dumps(stats),
-        )
+    pool = await get_pool()
+    await pool.execute(
+        """
+        UPDATE pipeline_runs SET
+            finished_at = NOW(),
+            status = $2,
+            markets_fetched = $3,
+            markets_new = $4,
+            markets_updated = $5,
+            locations_inferred = $6,
+            locations_geocoded = $7,
+            geocode_cache_hits = $8,
+            geocode_cache_misses = $9,
+            avg_confidence = $10,
+            error_message = $11,
+            metadata = $12
+        WHERE id = $1
+        """,
+        run_id,
+        "failed" if error else "completed",
+        stats.get("markets_fetched", 0),
+        stats.get("markets_new", 0),
+        stats.get("markets_updated", 0),
+        stats.get("locations_inferred", 0),
+        stats.get("locations_geocoded", 0),
+        stats.get("geocode_cache_hits", 0),
+        stats.get("geocode_cache_misses", 0),
+        stats.get("avg_confidence"),
+        error,
+        stats,
+    )
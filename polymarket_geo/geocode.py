@@ -3,7 +3,7 @@ Geocoding module with aggressive caching, rate limiting, and normalization.
 
 Strategy:
   1. Normalize the location string (lowercase, trim, expand abbreviations)
-  2. Check Postgres cache (geocode_cache table)
+  2. Check the in-process LRU, then the Postgres cache (geocode_cache table)
   3. If miss, call geocoder API with exponential backoff
   4. Store result in cache with TTL
   5. Update the market_locations row with lat/lon
@@ -16,6 +16,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Optional
 
 import httpx
@@ -23,9 +27,11 @@ import httpx
 from polymarket_geo.config import get_settings
 from polymarket_geo.db import (
     get_cached_geocode,
+    get_cached_geocode_many,
     get_ungeooded_locations,
+    record_geocode_hits,
     set_cached_geocode,
-    update_location_geocode,
+    update_location_geocodes,
 )
 from polymarket_geo.models import GeocodeResult
 
@@ -95,6 +101,11 @@ CITY_NORMALIZATIONS: dict[str, str] = {
 }
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_CITY_STATE_RE = re.compile(r"^(.+?),\s*([A-Z]{2})$")
+
+
+@lru_cache(maxsize=8192)
 def normalize_location_name(name: str) -> str:
     """
     Normalize a location string for consistent caching and geocoding.
@@ -105,14 +116,14 @@ def normalize_location_name(name: str) -> str:
       4. Remove extra punctuation
     """
     normalized = name.strip().lower()
-    normalized = re.sub(r"\s+", " ", normalized)  # collapse whitespace
+    normalized = _WHITESPACE_RE.sub(" ", normalized)  # collapse whitespace
 
     # Check known normalizations first
     if normalized in CITY_NORMALIZATIONS:
         return CITY_NORMALIZATIONS[normalized]
 
     # Try expanding state abbreviations for "City, ST" patterns
-    match = re.match(r"^(.+?),\s*([A-Z]{2})$", name.strip())
+    match = _CITY_STATE_RE.match(name.strip())
     if match:
         city = match.group(1).strip()
         state_abbr = match.group(2).upper()
@@ -136,11 +147,37 @@ class RateLimiter:
 
     async def acquire(self):
         async with self._lock:
-            now = asyncio.get_event_loop().time()
+            now = time.monotonic()
             elapsed = now - self._last_call
             if elapsed < self._interval:
                 await asyncio.sleep(self._interval - elapsed)
-            self._last_call = asyncio.get_event_loop().time()
+            self._last_call = time.monotonic()
+
+
+# ── Shared HTTP Client ────────────────────────────────────────────────
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared client so geocoder calls reuse pooled TCP/TLS connections."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared client and drop the cached geocoder. Both hold state
+    bound to the running event loop (pooled connections, the rate limiter's
+    asyncio.Lock), so the next loop starts with fresh ones.
+    """
+    global _http_client, _geocoder
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _geocoder = None
 
 
 # ── Geocoder Implementations ──────────────────────────────────────────
@@ -161,42 +198,42 @@ class NominatimGeocoder:
 
         for attempt in range(self.settings.max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        f"{self.settings.nominatim_url}/search",
-                        params={
-                            "q": query,
-                            "format": "json",
-                            "limit": 1,
-                            "addressdetails": 1,
-                        },
-                        headers={
-                            "User-Agent": self.settings.nominatim_user_agent,
-                        },
-                        timeout=10,
-                    )
-                    resp.raise_for_status()
-                    results = resp.json()
-
-                    if not results:
-                        logger.debug("Nominatim: no results for '%s'", query)
-                        return GeocodeResult(
-                            query=query,
-                            source="nominatim",
-                            from_cache=False,
-                        )
-
-                    top = results[0]
+                client = _get_http_client()
+                resp = await client.get(
+                    f"{self.settings.nominatim_url}/search",
+                    params={
+                        "q": query,
+                        "format": "json",
+                        "limit": 1,
+                        "addressdetails": 1,
+                    },
+                    headers={
+                        "User-Agent": self.settings.nominatim_user_agent,
+                    },
+                    timeout=10,
+                )
+                resp.raise_for_status()
+                results = resp.json()
+
+                if not results:
+                    logger.debug("Nominatim: no results for '%s'", query)
                     return GeocodeResult(
                         query=query,
-                        latitude=float(top["lat"]),
-                        longitude=float(top["lon"]),
-                        display_name=top.get("display_name"),
                         source="nominatim",
                         from_cache=False,
-                        raw=top,
                     )
 
+                top = results[0]
+                return GeocodeResult(
+                    query=query,
+                    latitude=float(top["lat"]),
+                    longitude=float(top["lon"]),
+                    display_name=top.get("display_name"),
+                    source="nominatim",
+                    from_cache=False,
+                    raw=top,
+                )
+
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
                     wait = self.settings.backoff_base ** (attempt + 1)
@@ -234,34 +271,34 @@ class GoogleGeocoder:
 
         for attempt in range(self.settings.max_retries):
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(
-                        "https://maps.googleapis.com/maps/api/geocode/json",
-                        params={
-                            "address": query,
-                            "key": self.settings.google_api_key,
-                        },
-                        timeout=10,
-                    )
-                    resp.raise_for_status()
-                    data = resp.json()
-
-                    if data.get("status") != "OK" or not data.get("results"):
-                        logger.debug("Google Geocoding: no results for '%s' (status=%s)",
-                                     query, data.get("status"))
-                        return GeocodeResult(query=query, source="google", from_cache=False)
-
-                    top = data["results"][0]
-                    loc = top["geometry"]["location"]
-                    return GeocodeResult(
-                        query=query,
-                        latitude=float(loc["lat"]),
-                        longitude=float(loc["lng"]),
-                        display_name=top.get("formatted_address"),
-                        source="google",
-                        from_cache=False,
-                        raw=top,
-                    )
+                client = _get_http_client()
+                resp = await client.get(
+                    "https://maps.googleapis.com/maps/api/geocode/json",
+                    params={
+                        "address": query,
+                        "key": self.settings.google_api_key,
+                    },
+                    timeout=10,
+                )
+                resp.raise_for_status()
+                data = resp.json()
+
+                if data.get("status") != "OK" or not data.get("results"):
+                    logger.debug("Google Geocoding: no results for '%s' (status=%s)",
+                                 query, data.get("status"))
+                    return GeocodeResult(query=query, source="google", from_cache=False)
+
+                top = data["results"][0]
+                loc = top["geometry"]["location"]
+                return GeocodeResult(
+                    query=query,
+                    latitude=float(loc["lat"]),
+                    longitude=float(loc["lng"]),
+                    display_name=top.get("formatted_address"),
+                    source="google",
+                    from_cache=False,
+                    raw=top,
+                )
 
             except Exception as e:
                 wait = self.settings.backoff_base ** (attempt + 1)
@@ -272,42 +309,106 @@ class GoogleGeocoder:
         return None
 
 
-# ── Geocoding Orchestrator ─────────────────────────────────────────────
+# ── In-Process Cache ──────────────────────────────────────────────────
 
-def get_geocoder():
-    """Factory: return the configured geocoder instance."""
-    provider = get_settings().geocoding.provider
-    if provider == "google":
-        return GoogleGeocoder()
-    return NominatimGeocoder()
+# normalized query -> (expires_at monotonic, result); hot queries skip the DB
+_memory_cache: OrderedDict[str, tuple[float, GeocodeResult]] = OrderedDict()
 
 
-async def geocode_location(location_name: str) -> GeocodeResult:
+def _memory_cache_get(normalized: str) -> GeocodeResult | None:
+    entry = _memory_cache.get(normalized)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at <= time.monotonic():
+        del _memory_cache[normalized]
+        return None
+    _memory_cache.move_to_end(normalized)
+    return result
+
+
+def _memory_cache_set(
+    normalized: str, result: GeocodeResult, expires_at: datetime | None = None
+) -> None:
     """
-    Geocode a location name with cache-first strategy.
-    1. Normalize the name
-    2. Check DB cache
-    3. If miss, call geocoder API
-    4. Store in cache
-    Returns GeocodeResult (may have None lat/lon if not found).
+    Remember a result until `expires_at` (the DB row's expiry), or for the
+    full cache TTL when it was just fetched from the provider.
     """
     settings = get_settings().geocoding
+    if settings.memory_cache_size <= 0:
+        return
+    if expires_at is None:
+        ttl = settings.cache_ttl_days * 86400
+    else:
+        ttl = (expires_at - datetime.now(UTC)).total_seconds()
+        if ttl <= 0:
+            return
+    entry = result.model_copy(update={"from_cache": True, "raw": None})
+    _memory_cache[normalized] = (time.monotonic() + ttl, entry)
+    _memory_cache.move_to_end(normalized)
+    while len(_memory_cache) > settings.memory_cache_size:
+        _memory_cache.popitem(last=False)
+
+
+# ── Geocoding Orchestrator ─────────────────────────────────────────────
+
+def _result_from_cache_row(normalized: str, cached: dict) -> GeocodeResult:
+    return GeocodeResult(
+        query=normalized,
+        latitude=cached["latitude"],
+        longitude=cached["longitude"],
+        display_name=cached.get("display_name"),
+        source=cached.get("source", "cache"),
+        from_cache=True,
+    )
+
+
+_geocoder: NominatimGeocoder | GoogleGeocoder | None = None
+
+
+def get_geocoder() -> NominatimGeocoder | GoogleGeocoder:
+    """
+    Return the configured geocoder instance.
+    One per process, so every caller shares its rate limiter.
+    """
+    global _geocoder
+    if _geocoder is None:
+        provider = get_settings().geocoding.provider
+        _geocoder = GoogleGeocoder() if provider == "google" else NominatimGeocoder()
+    return _geocoder
+
+
+async def lookup_cached_geocode(location_name: str) -> GeocodeResult | None:
+    """
+    Cache-only half of geocode_location: the in-process LRU, then the DB
+    cache. Never calls the provider; returns None on a miss.
+    """
     normalized = normalize_location_name(location_name)
 
+    memo = _memory_cache_get(normalized)
+    if memo is not None:
+        record_geocode_hits([normalized])
+        return memo
+
     # Check cache
     cached = await get_cached_geocode(normalized)
     if cached is not None:
         logger.debug("Geocode cache HIT: '%s'", normalized)
-        return GeocodeResult(
-            query=normalized,
-            latitude=cached["latitude"],
-            longitude=cached["longitude"],
-            display_name=cached.get("display_name"),
-            source=cached.get("source", "cache"),
-            from_cache=True,
-        )
+        result = _result_from_cache_row(normalized, cached)
+        _memory_cache_set(normalized, result, cached.get("expires_at"))
+        return result
 
     logger.debug("Geocode cache MISS: '%s'", normalized)
+    return None
+
+
+async def fetch_geocode(location_name: str) -> GeocodeResult:
+    """
+    Provider half of geocode_location: call the geocoder API and store the
+    result (even a negative one) in both caches.
+    """
+    settings = get_settings().geocoding
+    normalized = normalize_location_name(location_name)
 
     # Call geocoder
     geocoder = get_geocoder()
@@ -326,13 +427,34 @@ async def geocode_location(location_name: str) -> GeocodeResult:
         raw_response=result.raw,
         ttl_days=settings.cache_ttl_days,
     )
+    _memory_cache_set(normalized, result)
 
     return result
 
 
+async def geocode_location(location_name: str) -> GeocodeResult:
+    """
+    Geocode a location name with cache-first strategy.
+    1. Normalize the name
+    2. Check the in-process LRU, then the DB cache
+    3. If miss, call geocoder API
+    4. Store in cache
+    Returns GeocodeResult (may have None lat/lon if not found).
+    """
+    result = await lookup_cached_geocode(location_name)
+    if result is not None:
+        return result
+    return await fetch_geocode(location_name)
+
+
 async def geocode_pending_locations(limit: int = 500) -> dict:
     """
     Fetch all ungeooded location rows and geocode them.
+    Rows are grouped by normalized name so each distinct name is looked up
+    once. Names are processed concurrently (bounded by GEOCODER_CONCURRENCY);
+    provider calls still go through the shared rate limiter. Cached names are
+    looked up in one query up front, and coordinates are written back in one
+    batched UPDATE at the end.
     Returns stats dict with cache hits/misses.
     """
     stats = {"total": 0, "geocoded": 0, "failed": 0, "cache_hits": 0, "cache_misses": 0}
@@ -340,34 +462,57 @@ async def geocode_pending_locations(limit: int = 500) -> dict:
     locations = await get_ungeooded_locations(limit)
     stats["total"] = len(locations)
 
+    # Skip global locations
+    by_name: dict[str, list] = {}
     for loc in locations:
-        location_id = loc["id"]
-        location_name = loc["location_name"]
-
-        # Skip global locations
-        if loc["location_type"] == "global":
-            continue
-
-        result = await geocode_location(location_name)
+        if loc["location_type"] != "global":
+            normalized = normalize_location_name(loc["location_name"])
+            by_name.setdefault(normalized, []).append(loc)
+
+    # One DB round trip for every name not already in the in-process LRU
+    prefetched: dict[str, GeocodeResult] = {}
+    cold = [n for n in by_name if _memory_cache_get(n) is None]
+    for normalized, row in (await get_cached_geocode_many(cold)).items():
+        prefetched[normalized] = _result_from_cache_row(normalized, row)
+        _memory_cache_set(normalized, prefetched[normalized], row.get("expires_at"))
+
+    semaphore = asyncio.Semaphore(max(1, get_settings().geocoding.concurrency))
+    updates: list[tuple[int, float, float, str, dict | None]] = []
+
+    async def _geocode_name(normalized: str, rows: list) -> None:
+        result = prefetched.get(normalized)
+        if result is None:
+            try:
+                async with semaphore:
+                    result = await geocode_location(rows[0]["location_name"])
+            except Exception as e:
+                # Don't lose the rest of the batch to one bad lookup
+                logger.error("Geocoding '%s' failed: %s", normalized, e)
+                stats["failed"] += len(rows)
+                return
 
+        # Later rows with the same name would have hit the cache
+        stats["cache_hits"] += len(rows) - 1
         if result.from_cache:
             stats["cache_hits"] += 1
         else:
             stats["cache_misses"] += 1
 
-        if result.latitude is not None and result.longitude is not None:
-            await update_location_geocode(
-                location_id=location_id,
-                latitude=result.latitude,
-                longitude=result.longitude,
-                source=result.source,
-                raw_response=result.raw,
+        if result.latitude is None or result.longitude is None:
+            stats["failed"] += len(rows)
+            for loc in rows:
+                logger.warning("Failed to geocode location '%s' (id=%d)",
+                               loc["location_name"], loc["id"])
+            return
+
+        for loc in rows:
+            updates.append(
+                (loc["id"], result.latitude, result.longitude, result.source, result.raw)
             )
-            stats["geocoded"] += 1
-        else:
-            stats["failed"] += 1
-            logger.warning("Failed to geocode location '%s' (id=%d)",
-                           location_name, location_id)
+        stats["geocoded"] += len(rows)
+
+    await asyncio.gather(*(_geocode_name(n, rows) for n, rows in by_name.items()))
+    await update_location_geocodes(updates)
 
     logger.info("Geocoding complete: %s", stats)
     return stats
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import re
+import threading
 
 from polymarket_geo.models import InferenceMethod, LocationCandidate, LocationType, MarketInferenceResult
-from polymarket_geo.semantic.composer import TextComposer
+from polymarket_geo.semantic.composer import ComposedText, TextComposer
 from polymarket_geo.semantic.decider import GeoTypeDecider
 from polymarket_geo.semantic.event_type import EventTypeClassifier
 from polymarket_geo.semantic.indexes import LocalIndexes
 from polymarket_geo.semantic.output_schema import EvidenceItem, GeoInferenceOutput, LocationHypothesis
-from polymarket_geo.semantic.retriever import Retriever
+from polymarket_geo.semantic.retriever import RetrievalHit, Retriever
 from polymarket_geo.semantic.scorer import Scorer
 
+# Head-to-head phrasing ("X vs Y") or an action aimed at another party ("strike on X")
+_MULTI_QUERY_RE = re.compile(
+    r"\b(?:vs\.?|versus|against|between)\b"
+    r"|\b(?:strike|attack|invade|sanctions?)\b.*\b(?:on|against)\b"
+)
+_POLICY_PROTOTYPE = (
+    "government policy legislation regulation court election federal parliament congress "
+    "immigration deportation border enforcement sanctions"
+)
 
 @dataclass
 class SemanticPipeline:
@@ -40,6 +51,8 @@ class LocationInferenceEngine:
 
     def __init__(self):
         self.pipeline = SemanticPipeline.build()
+        # Constant across markets, so embed it once instead of per inference
+        self._policy_vec = self.pipeline.indexes.embedder.embed(_POLICY_PROTOTYPE)
 
     def infer_semantic(
         self,
@@ -49,14 +62,24 @@ class LocationInferenceEngine:
         top_k: int = 5,
     ) -> GeoInferenceOutput:
         composed = TextComposer.compose(title=title, description=description, choices=choices)
-        field_texts = {
+        hits = self.pipeline.retriever.retrieve(self._field_texts(composed), top_n=10)
+        return self._infer_from_hits(composed, hits, top_k=top_k)
+
+    @staticmethod
+    def _field_texts(composed: ComposedText) -> dict[str, str]:
+        return {
             "title": composed.title_text,
             "description": composed.description_text,
             "choices": composed.choices_text,
             "combined": composed.combined_text,
         }
 
-        hits = self.pipeline.retriever.retrieve(field_texts, top_n=10)
+    def _infer_from_hits(
+        self,
+        composed: ComposedText,
+        hits: dict[str, list[RetrievalHit]],
+        top_k: int = 5,
+    ) -> GeoInferenceOutput:
         scored = self.pipeline.scorer.score(hits, top_k=top_k)
 
         locations: list[LocationHypothesis] = []
@@ -97,10 +120,7 @@ class LocationInferenceEngine:
             locations.sort(key=lambda x: x.confidence, reverse=True)
             top_conf = locations[0].confidence
             q = composed.combined_text.lower()
-            multi_query = bool(
-                re.search(r"\b(vs\.?|versus|against|between)\b", q)
-                or re.search(r"\b(strike|attack|invade|sanctions?)\b.*\b(on|against)\b", q)
-            )
+            multi_query = _MULTI_QUERY_RE.search(q) is not None
             cutoff = 0.15 if multi_query else min(0.28, max(0.15, top_conf - 0.09))
             filtered: list[LocationHypothesis] = []
             for loc in locations:
@@ -194,11 +214,7 @@ class LocationInferenceEngine:
             return True
         model = self.pipeline.indexes.embedder
         qv = model.embed(combined_text)
-        pv = model.embed(
-            "government policy legislation regulation court election federal parliament congress "
-            "immigration deportation border enforcement sanctions"
-        )
-        sim = model.cosine(qv, pv)
+        sim = model.cosine(qv, self._policy_vec)
         return sim >= 0.08
 
     def _country_for_location(self, location: LocationHypothesis) -> str | None:
@@ -219,7 +235,30 @@ class LocationInferenceEngine:
     ) -> MarketInferenceResult:
         """Compatibility output for legacy API/database pipeline callers."""
         semantic = self.infer_semantic(question, description=description, choices=choices)
+        return self._to_market_result(condition_id, semantic)
+
+    def infer_batch(
+        self,
+        items: list[tuple[str, str, str | None]],
+        batch_size: int = 32,
+    ) -> list[MarketInferenceResult]:
+        """
+        Batched infer() over (condition_id, question, description) tuples.
+        Retrieval for each chunk of items is embedded and scored in one pass.
+        """
+        results: list[MarketInferenceResult] = []
+        for start in range(0, len(items), batch_size):
+            chunk = items[start:start + batch_size]
+            composed = [TextComposer.compose(title=q, description=d) for _, q, d in chunk]
+            hits = self.pipeline.retriever.retrieve_many(
+                [self._field_texts(c) for c in composed], top_n=10
+            )
+            for (condition_id, _, _), c, h in zip(chunk, composed, hits):
+                results.append(self._to_market_result(condition_id, self._infer_from_hits(c, h)))
+        return results
 
+    @staticmethod
+    def _to_market_result(condition_id: str, semantic: GeoInferenceOutput) -> MarketInferenceResult:
         type_map = {
             "city": LocationType.CITY,
             "state": LocationType.STATE,
@@ -250,3 +289,28 @@ class LocationInferenceEngine:
             has_location=bool(locs),
             is_global=(semantic.geo_type == "global"),
         )
+
+
+_engine: LocationInferenceEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> LocationInferenceEngine:
+    """Process-wide engine; building it loads the local indexes."""
+    global _engine
+    if _engine is None:
+        # First use can come from several worker threads at once
+        with _engine_lock:
+            if _engine is None:
+                _engine = LocationInferenceEngine()
+    return _engine
+
+
+def _infer_batch_sync(items: list[tuple[str, str, str | None]]) -> list[MarketInferenceResult]:
+    return get_engine().infer_batch(items)
+
+
+async def infer_locations_batch(markets: list[dict]) -> list[MarketInferenceResult]:
+    """Pipeline entry point: infer locations for market rows off the event loop."""
+    items = [(m["condition_id"], m["question"], m.get("description")) for m in markets]
+    return await asyncio.to_thread(_infer_batch_sync, items)
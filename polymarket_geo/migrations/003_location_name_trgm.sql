@@ -0,0 +1,6 @@
+-- Migration 003: Trigram index on location names for /search
+-- Serves ILIKE '%term%' lookups on market_locations (markets.question is
+-- already covered by idx_markets_question_trgm).
+
+CREATE INDEX IF NOT EXISTS idx_market_locations_name_trgm
+    ON market_locations USING gin (location_name gin_trgm_ops);
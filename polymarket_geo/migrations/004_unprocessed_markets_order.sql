@@ -0,0 +1,12 @@
+-- Migration 004: Partial indexes for iter_unprocessed_markets
+-- Never-processed markets are walked newest-first without sorting the whole
+-- markets table. The stale-version branch filters on a range (geo_version < $1),
+-- so its index serves the filter, not the ORDER BY: it finds the stale rows
+-- without touching up-to-date ones (none at all in steady state), and only
+-- those are sorted by created_at.
+
+CREATE INDEX IF NOT EXISTS idx_markets_unprocessed_created
+    ON markets (created_at DESC) WHERE geo_processed = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_markets_processed_version_created
+    ON markets (geo_version, created_at DESC) WHERE geo_processed = TRUE;
@@ -0,0 +1,9 @@
+-- Migration 005: Full-text search vector on market question + description
+-- Used by /search alongside the trigram ILIKE lookups.
+
+ALTER TABLE markets
+    ADD COLUMN IF NOT EXISTS tsv tsvector GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(question, '') || ' ' || coalesce(description, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_markets_tsv ON markets USING gin (tsv);
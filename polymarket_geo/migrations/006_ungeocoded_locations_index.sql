@@ -0,0 +1,8 @@
+-- Migration 006: Covering partial index for get_ungeooded_locations
+-- Matches its exact predicate and ORDER BY, so the geocoding stage reads
+-- the top candidates with an index-only scan bounded by LIMIT.
+
+CREATE INDEX IF NOT EXISTS idx_market_locations_ungeocoded
+    ON market_locations (confidence DESC)
+    INCLUDE (id, location_name, location_type)
+    WHERE geocoded = FALSE AND location_type <> 'global';
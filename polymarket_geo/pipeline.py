@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import aclosing
 
 from polymarket_geo.config import get_settings
 from polymarket_geo.db import (
     finish_pipeline_run,
-    get_unprocessed_markets,
+    iter_unprocessed_markets,
     save_inference_result,
     start_pipeline_run,
 )
@@ -68,28 +69,32 @@ async def run_pipeline() -> dict:
 
         # ── Stage 2: Inference ─────────────────────────────────────────
         logger.info("=== Pipeline Stage 2: Inference (version=%d) ===", geo_version)
-        unprocessed = await get_unprocessed_markets(geo_version, limit=batch_size)
-        logger.info("Found %d markets to process", len(unprocessed))
-
-        if unprocessed:
-            results = await infer_locations_batch(unprocessed)
-
-            total_locs = 0
-            total_conf = 0.0
-            conf_count = 0
-
-            for result in results:
-                await save_inference_result(result, geo_version)
-                n_locs = len(result.locations)
-                total_locs += n_locs
-                for loc in result.locations:
-                    total_conf += loc.confidence
-                    conf_count += 1
-
+        n_markets = 0
+        total_locs = 0
+        total_conf = 0.0
+        conf_count = 0
+
+        # Markets stream in chunks, so inference starts before the full set is read
+        async with aclosing(iter_unprocessed_markets(geo_version, limit=batch_size)) as chunks:
+            async for chunk in chunks:
+                n_markets += len(chunk)
+                results = await infer_locations_batch(chunk)
+
+                for result in results:
+                    await save_inference_result(result, geo_version)
+                    n_locs = len(result.locations)
+                    total_locs += n_locs
+                    for loc in result.locations:
+                        total_conf += loc.confidence
+                        conf_count += 1
+
+        if n_markets:
             stats["locations_inferred"] = total_locs
             stats["avg_confidence"] = round(total_conf / conf_count, 4) if conf_count > 0 else None
             logger.info("Inference done: %d locations from %d markets (avg conf: %s)",
-                         total_locs, len(unprocessed), stats["avg_confidence"])
+                         total_locs, n_markets, stats["avg_confidence"])
+        else:
+            logger.info("No markets to process")
 
         # ── Stage 3: Geocoding ─────────────────────────────────────────
         logger.info("=== Pipeline Stage 3: Geocoding ===")
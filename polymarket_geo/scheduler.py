@@ -74,10 +74,12 @@ def stop_scheduler() -> None:
 async def run_once():
     """Run the pipeline once (for CLI / testing)."""
     from polymarket_geo.db import close_pool, get_pool
+    from polymarket_geo.geocode import close_http_client
 
     await get_pool()
     try:
         stats = await run_pipeline()
         return stats
     finally:
+        await close_http_client()
         await close_pool()
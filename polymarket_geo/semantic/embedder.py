@@ -3,9 +3,13 @@ from __future__ import annotations
 import hashlib
 import math
 import re
+from functools import lru_cache
 
 import numpy as np
 
+# Runs of [a-z0-9] after lowercasing; everything else separates tokens.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 
 class LocalEmbeddingModel:
     """
@@ -54,9 +58,7 @@ class LocalEmbeddingModel:
     def _tokenize(text: str) -> list[str]:
         folded = text.lower()
         folded = folded.replace("u.s.a.", " usa ").replace("u.s.", " us ")
-        folded = re.sub(r"[^a-z0-9\s]", " ", folded)
-        folded = re.sub(r"\s+", " ", folded).strip()
-        toks = [t for t in folded.split(" ") if t]
+        toks = _TOKEN_RE.findall(folded)
         norm: list[str] = []
         for t in toks:
             if t.endswith("ation"):
@@ -68,7 +70,9 @@ class LocalEmbeddingModel:
             norm.append(t)
         return norm
 
+    # Token/bigram vocabulary repeats heavily across titles; skip re-hashing.
     @staticmethod
+    @lru_cache(maxsize=65536)
     def _hash(value: str) -> int:
         return int(hashlib.sha1(value.encode("utf-8")).hexdigest()[:12], 16)
 
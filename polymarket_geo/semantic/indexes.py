@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import numpy as np
@@ -9,7 +10,7 @@ import numpy as np
 from polymarket_geo.semantic.embedder import LocalEmbeddingModel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexRecord:
     doc_id: str
     index_type: str
@@ -44,7 +45,8 @@ class LocalIndexes:
         seed_is_newer = seed_file.exists() and records_file.exists() and seed_file.stat().st_mtime > records_file.stat().st_mtime
         if records_file.exists() and vectors_file.exists() and not seed_is_newer:
             self.records = self._read_records(records_file)
-            self.matrix = np.load(vectors_file)
+            # Mapped read-only: paged in on demand, shared across worker processes
+            self.matrix = np.load(vectors_file, mmap_mode="r")
             return
 
         if not seed_file.exists():
@@ -56,7 +58,11 @@ class LocalIndexes:
         self.records = self._read_records(seed_file)
         self.matrix = self.embedder.embed_many([r.searchable_text for r in self.records])
         self._write_records(records_file, self.records)
-        np.save(vectors_file, self.matrix)
+        # Atomic replace so processes mapping the old file are unaffected
+        tmp_file = vectors_file.with_suffix(".npy.tmp")
+        with tmp_file.open("wb") as f:
+            np.save(f, self.matrix)
+        tmp_file.replace(vectors_file)
 
     def _read_records(self, file_path: Path) -> list[IndexRecord]:
         out: list[IndexRecord] = []
@@ -65,13 +71,17 @@ class LocalIndexes:
                 if not line.strip():
                     continue
                 row = json.loads(line)
+                # Low-cardinality labels repeat on every record; share one object each
+                for key in ("index_type", "granularity", "country"):
+                    if row.get(key) is not None:
+                        row[key] = sys.intern(row[key])
                 out.append(IndexRecord(**row))
         return out
 
     def _write_records(self, file_path: Path, records: list[IndexRecord]) -> None:
         with file_path.open("w", encoding="utf-8") as f:
             for r in records:
-                f.write(json.dumps(r.__dict__) + "\n")
+                f.write(json.dumps(asdict(r)) + "\n")
 
     def _build_lookups(self) -> None:
         place_to_records: dict[str, list[IndexRecord]] = {}
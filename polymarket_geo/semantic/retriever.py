@@ -32,10 +32,44 @@ class Retriever:
 
             qv = self.embedder.embed(text)
             sims = self.indexes.matrix @ qv
-            idxs = np.argsort(-sims)[:top_n]
-            hits = [
-                RetrievalHit(field=field, record=self.indexes.records[int(i)], score=score_to_unit(float(sims[int(i)])))
-                for i in idxs
-            ]
-            out[field] = [h for h in hits if h.score >= 0.05]
+            out[field] = self._top_hits(field, sims, top_n)
+        return out
+
+    def retrieve_many(
+        self,
+        batch: list[dict[str, str]],
+        top_n: int = 8,
+    ) -> list[dict[str, list[RetrievalHit]]]:
+        """Batched retrieve(): all field texts are scored against the index in one matmul."""
+        out: list[dict[str, list[RetrievalHit]]] = [{k: [] for k in ft} for ft in batch]
+        if self.indexes.matrix.shape[0] == 0:
+            return out
+
+        keys = [
+            (i, field) for i, ft in enumerate(batch) for field, text in ft.items() if text.strip()
+        ]
+        if not keys:
+            return out
+
+        queries = self.embedder.embed_many([batch[i][field] for i, field in keys])
+        sims = queries @ self.indexes.matrix.T
+        for (i, field), row in zip(keys, sims):
+            out[i][field] = self._top_hits(field, row, top_n)
         return out
+
+    def _top_hits(self, field: str, sims: np.ndarray, top_n: int) -> list[RetrievalHit]:
+        if 0 < top_n < sims.shape[0]:
+            # Select the top_n in O(n), then order only those
+            part = np.argpartition(-sims, top_n - 1)[:top_n]
+            idxs = part[np.argsort(-sims[part])]
+        else:
+            idxs = np.argsort(-sims)[:top_n]
+        hits = [
+            RetrievalHit(
+                field=field,
+                record=self.indexes.records[int(i)],
+                score=score_to_unit(float(sims[int(i)])),
+            )
+            for i in idxs
+        ]
+        return [h for h in hits if h.score >= 0.05]
@@ -0,0 +1,260 @@
+"""
+Tests for API response helpers.
+Unit tests for row -> response model conversion (no DB required).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from polymarket_geo import api
+from polymarket_geo.api import _format_market, _group_rows_to_markets
+from polymarket_geo.models import GeocodeResult
+
+
+def _row(market_id: int, location_id: int | None, **overrides) -> dict:
+    row = {
+        "id": market_id,
+        "condition_id": f"cond-{market_id}",
+        "question": "Will it rain in Atlanta?",
+        "description": None,
+        "category": "weather",
+        "active": True,
+        "volume": Decimal("1250.50"),
+        "location_id": location_id,
+        "location_name": "Atlanta, GA" if location_id else None,
+        "location_type": "city" if location_id else None,
+        "confidence": 0.9 if location_id else None,
+        "reason": "test" if location_id else None,
+        "latitude": 33.749 if location_id else None,
+        "longitude": -84.388 if location_id else None,
+        "inference_method": "nlp" if location_id else None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestGroupRows:
+    def test_merges_locations_per_market(self):
+        rows = [
+            _row(1, 10),
+            _row(1, 11, location_name="Georgia", location_type="state"),
+            _row(2, 12),
+        ]
+        markets = _group_rows_to_markets(rows)
+        assert [m.id for m in markets] == [1, 2]
+        assert [loc.location_name for loc in markets[0].locations] == ["Atlanta, GA", "Georgia"]
+        assert len(markets[1].locations) == 1
+
+    def test_market_without_locations(self):
+        markets = _group_rows_to_markets([_row(3, None)])
+        assert len(markets) == 1
+        assert markets[0].locations == []
+
+    def test_numeric_volume_is_float(self):
+        market = _group_rows_to_markets([_row(1, 10)])[0]
+        assert isinstance(market.volume, float)
+        assert market.model_dump()["volume"] == 1250.5
+
+    def test_empty_rows(self):
+        assert _group_rows_to_markets([]) == []
+
+
+class TestFormatMarket:
+    def test_single_market_with_locations(self):
+        row = {
+            "id": 7,
+            "condition_id": "cond-7",
+            "question": "Test?",
+            "volume": None,
+            "locations": [
+                {
+                    "location_name": "London, United Kingdom",
+                    "location_type": "city",
+                    "confidence": 0.8,
+                },
+            ],
+        }
+        market = _format_market(row)
+        assert market.id == 7
+        assert market.volume is None
+        assert market.locations[0].inference_method == "unknown"
+        assert market.locations[0].latitude is None
+
+
+class TestNearbyEndpoint:
+    def test_serializes_grouped_markets(self, monkeypatch):
+        async def fake_query(**kwargs):
+            return [_row(1, 10), _row(1, 11, location_name="Georgia"), _row(2, 12)], 2
+
+        monkeypatch.setattr(api, "query_nearby_markets", fake_query)
+        params = {"lat": 33.7, "lon": -84.4, "radius_km": 25}
+        resp = TestClient(api.app).get("/nearby", params=params)
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["total"] == 2
+        assert body["radius_km"] == 25.0
+        assert [m["id"] for m in body["markets"]] == [1, 2]
+        assert body["markets"][0]["volume"] == 1250.5
+        assert len(body["markets"][0]["locations"]) == 2
+
+    def test_rejects_radius_over_max(self):
+        resp = TestClient(api.app).get("/nearby", params={"lat": 0, "lon": 0, "radius_km": 10_000})
+        assert resp.status_code == 400
+
+
+class TestMarketRoutes:
+    def test_dispatches_on_id_shape(self, monkeypatch):
+        calls = []
+
+        async def by_id(market_id):
+            calls.append(("id", market_id))
+            return {"id": market_id, "condition_id": "0xabc", "question": "Q?"}
+
+        async def by_condition(condition_id):
+            calls.append(("condition", condition_id))
+            return None
+
+        monkeypatch.setattr(api, "get_market_by_id", by_id)
+        monkeypatch.setattr(api, "get_market_by_condition_id", by_condition)
+        client = TestClient(api.app)
+
+        assert client.get("/market/42").json()["id"] == 42
+        assert client.get("/market/0xabc").status_code == 404
+        assert client.get("/market/id/7").status_code == 200
+        assert client.get("/market/id/abc").status_code == 422
+        assert calls == [("id", 42), ("condition", "0xabc"), ("id", 7)]
+
+    def test_non_ascii_digits_route_to_condition_id(self, monkeypatch):
+        calls = []
+
+        async def by_condition(condition_id):
+            calls.append(condition_id)
+            return None
+
+        monkeypatch.setattr(api, "get_market_by_condition_id", by_condition)
+
+        assert TestClient(api.app).get("/market/²").status_code == 404
+        assert calls == ["²"]
+
+
+class TestSearchEndpoint:
+    def _patch(self, monkeypatch, text_rows, cached=None):
+        calls = {"lookup": [], "fetch": []}
+
+        async def fake_text(q, limit, offset):
+            return text_rows, len(text_rows)
+
+        async def fake_lookup(q):
+            calls["lookup"].append(q)
+            return cached
+
+        async def fake_fetch(q):
+            calls["fetch"].append(q)
+            return GeocodeResult(query=q, latitude=33.7, longitude=-84.4, source="nominatim")
+
+        async def fake_nearby(**kwargs):
+            return [_row(9, 90)], 1
+
+        monkeypatch.setattr(api, "query_markets_by_text", fake_text)
+        monkeypatch.setattr(api, "lookup_cached_geocode", fake_lookup)
+        monkeypatch.setattr(api, "fetch_geocode", fake_fetch)
+        monkeypatch.setattr(api, "query_nearby_markets", fake_nearby)
+        return calls
+
+    def test_full_text_page_skips_provider(self, monkeypatch):
+        calls = self._patch(monkeypatch, [_row(1, 10), _row(2, 12)])
+        body = TestClient(api.app).get("/search", params={"q": "Atlanta", "limit": 2}).json()
+
+        assert calls["fetch"] == []
+        assert [m["id"] for m in body["markets"]] == [1, 2]
+        assert body["resolved_lat"] is None
+
+    def test_short_text_page_geocodes_cache_miss(self, monkeypatch):
+        calls = self._patch(monkeypatch, [_row(1, 10)])
+        body = TestClient(api.app).get("/search", params={"q": "Atlanta", "limit": 5}).json()
+
+        assert calls == {"lookup": ["Atlanta"], "fetch": ["Atlanta"]}
+        assert [m["id"] for m in body["markets"]] == [1, 9]
+        assert body["resolved_lat"] == 33.7
+
+    def test_short_text_page_uses_cache_hit(self, monkeypatch):
+        hit = GeocodeResult(query="Atlanta", latitude=33.7, longitude=-84.4, from_cache=True)
+        calls = self._patch(monkeypatch, [_row(1, 10)], cached=hit)
+        body = TestClient(api.app).get("/search", params={"q": "Atlanta", "limit": 5}).json()
+
+        assert calls["fetch"] == []
+        assert [m["id"] for m in body["markets"]] == [1, 9]
+
+    async def test_discarded_failed_lookup_is_retrieved(self):
+        async def boom():
+            raise RuntimeError("db down")
+
+        task = asyncio.create_task(boom())
+        await asyncio.sleep(0)
+        api._discard_task(task)
+
+        loop = asyncio.get_running_loop()
+        errors = []
+        loop.set_exception_handler(lambda _loop, ctx: errors.append(ctx))
+        try:
+            del task
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert errors == []
+
+
+class TestMetricsSnapshot:
+    async def test_concurrent_callers_share_one_refresh(self, monkeypatch):
+        calls = 0
+
+        async def fake_metrics():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total_markets": calls}
+
+        monkeypatch.setattr(api, "get_pipeline_metrics", fake_metrics)
+        monkeypatch.setattr(api, "_metrics_cache", {"ts": None, "data": {}})
+        monkeypatch.setattr(api, "_metrics_refresh", None)
+
+        results = await asyncio.gather(*(api._get_metrics() for _ in range(5)))
+        assert calls == 1
+        assert all(r == {"total_markets": 1} for r in results)
+
+        # A fresh snapshot is served without touching the database
+        assert await api._get_metrics() == {"total_markets": 1}
+        assert calls == 1
+
+    async def test_first_call_refreshes_before_loop_runs(self, monkeypatch):
+        async def fake_metrics():
+            return {"total_markets": 7}
+
+        monkeypatch.setattr(api, "get_pipeline_metrics", fake_metrics)
+        monkeypatch.setattr(api, "_metrics_cache", {"ts": None, "data": {}})
+        monkeypatch.setattr(api, "_metrics_refresh", None)
+        # A fresh boot can have a monotonic clock below the max snapshot age
+        monkeypatch.setattr(api, "time", SimpleNamespace(monotonic=lambda: 1.0))
+
+        assert await api._get_metrics() == {"total_markets": 7}
+
+    async def test_stale_snapshot_is_recomputed(self, monkeypatch):
+        async def fake_metrics():
+            return {"total_markets": 2}
+
+        max_age = 3 * api._API_SETTINGS.metrics_refresh_seconds
+        monkeypatch.setattr(api, "get_pipeline_metrics", fake_metrics)
+        monkeypatch.setattr(api, "_metrics_refresh", None)
+        monkeypatch.setattr(
+            api, "_metrics_cache",
+            {"ts": api.time.monotonic() - max_age - 1, "data": {"total_markets": 1}},
+        )
+
+        assert await api._get_metrics() == {"total_markets": 2}
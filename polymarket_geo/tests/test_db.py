@@ -0,0 +1,115 @@
+"""
+Tests for the database module.
+Unit tests against fake pools/connections (no Postgres required).
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+from polymarket_geo import db
+
+
+class FakeMigrationConn:
+    """Records statements; schema_migrations reports `applied` as the max version."""
+
+    def __init__(self, has_table: bool, applied: int):
+        self.has_table = has_table
+        self.applied = applied
+        self.statements: list[str] = []
+
+    async def fetchval(self, sql, *args):
+        self.statements.append(sql)
+        if "to_regclass" in sql:
+            return self.has_table
+        return self.applied
+
+    async def execute(self, sql, *args):
+        self.statements.append(sql)
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+def _use_conn(monkeypatch, conn):
+    @asynccontextmanager
+    async def fake_get_connection():
+        yield conn
+
+    monkeypatch.setattr(db, "get_connection", fake_get_connection)
+
+
+class TestRunMigrations:
+    async def test_up_to_date_skips_lock(self, monkeypatch):
+        conn = FakeMigrationConn(has_table=True, applied=db.SCHEMA_VERSION)
+        _use_conn(monkeypatch, conn)
+
+        await db.run_migrations()
+
+        assert not any("pg_advisory_xact_lock" in s for s in conn.statements)
+
+    async def test_versions_read_under_lock(self, monkeypatch):
+        conn = FakeMigrationConn(has_table=False, applied=0)
+        _use_conn(monkeypatch, conn)
+
+        await db.run_migrations()
+
+        lock = next(i for i, s in enumerate(conn.statements) if "pg_advisory_xact_lock" in s)
+        read = next(i for i, s in enumerate(conn.statements) if "MAX(version)" in s)
+        assert lock < read
+        assert "INSERT INTO schema_migrations" in conn.statements[-1]
+
+    async def test_applied_by_another_worker_while_waiting(self, monkeypatch):
+        # Stale fast-path read, but the locked re-read sees everything applied
+        conn = FakeMigrationConn(has_table=True, applied=0)
+        reads = iter([0, db.SCHEMA_VERSION])
+
+        async def fetchval(sql, *args):
+            conn.statements.append(sql)
+            return True if "to_regclass" in sql else next(reads)
+
+        conn.fetchval = fetchval
+        _use_conn(monkeypatch, conn)
+
+        await db.run_migrations()
+
+        assert not any("INSERT INTO schema_migrations" in s for s in conn.statements)
+
+
+class FakeHitPool:
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, sql, *args):
+        self.executed.append(args)
+
+
+class TestHitCountBuffer:
+    async def test_hits_flushed_in_one_statement(self, monkeypatch):
+        pool = FakeHitPool()
+        monkeypatch.setattr(db, "_pool", pool)
+        monkeypatch.setattr(db, "_geocode_hits", db.Counter())
+        monkeypatch.setattr(db, "_buffered_hits", 0)
+        db.record_geocode_hits(["Atlanta, GA, USA"] * 3 + ["Paris, France"])
+
+        await db.flush_geocode_hits()
+
+        assert pool.executed == [(["Atlanta, GA, USA", "Paris, France"], [3, 1])]
+        assert not db._geocode_hits
+        assert db._buffered_hits == 0
+
+    async def test_threshold_triggers_early_flush(self, monkeypatch):
+        pool = FakeHitPool()
+        monkeypatch.setattr(db, "_pool", pool)
+        monkeypatch.setattr(db, "_geocode_hits", db.Counter())
+        monkeypatch.setattr(db, "_buffered_hits", 0)
+        monkeypatch.setattr(db, "_threshold_flush", None)
+        monkeypatch.setattr(db, "_HIT_FLUSH_THRESHOLD", 3)
+
+        db.record_geocode_hits(["a", "b"])
+        assert db._threshold_flush is None
+
+        db.record_geocode_hits(["a"])
+        await db._threshold_flush
+        assert pool.executed == [(["a", "b"], [2, 1])]
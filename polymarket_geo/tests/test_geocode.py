@@ -5,8 +5,13 @@ Unit tests for normalization (no network/DB required).
 
 from __future__ import annotations
 
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
+from polymarket_geo import geocode
 from polymarket_geo.geocode import normalize_location_name
 
 
@@ -66,3 +71,151 @@ class TestNormalizationEdgeCases:
 
     def test_sf_disambiguation(self):
         assert normalize_location_name("SF") == "San Francisco, CA, USA"
+
+
+class TestMemoryCache:
+    @pytest.fixture
+    def db_row(self, monkeypatch):
+        calls = []
+        hits = []
+        row = {
+            "latitude": 33.749,
+            "longitude": -84.388,
+            "display_name": "Atlanta",
+            "source": "nominatim",
+            "expires_at": datetime.now(UTC) + timedelta(hours=1),
+        }
+
+        async def fake_get_cached(query_normalized):
+            calls.append(query_normalized)
+            return row
+
+        monkeypatch.setattr(geocode, "get_cached_geocode", fake_get_cached)
+        monkeypatch.setattr(geocode, "record_geocode_hits", hits.extend)
+        monkeypatch.setattr(geocode, "_memory_cache", geocode.OrderedDict())
+        return row, calls, hits
+
+    async def test_repeat_lookup_skips_db(self, db_row):
+        _, calls, hits = db_row
+        first = await geocode.geocode_location("Atlanta")
+        second = await geocode.geocode_location("  atlanta ")
+
+        assert calls == ["Atlanta, GA, USA"]
+        assert hits == ["Atlanta, GA, USA"]
+        assert second.from_cache is True
+        assert (second.latitude, second.longitude) == (first.latitude, first.longitude)
+
+    async def test_db_hit_keeps_row_expiry(self, db_row):
+        row, _, _ = db_row
+        await geocode.geocode_location("Atlanta")
+
+        deadline, _ = geocode._memory_cache["Atlanta, GA, USA"]
+        assert deadline - time.monotonic() <= 3600
+
+    async def test_expired_row_not_memoized(self, db_row):
+        row, calls, _ = db_row
+        row["expires_at"] = datetime.now(UTC) - timedelta(seconds=1)
+        await geocode.geocode_location("Atlanta")
+        await geocode.geocode_location("Atlanta")
+
+        assert len(calls) == 2
+
+
+class TestGeocoderSingleton:
+    def test_rate_limiter_shared_across_calls(self, monkeypatch):
+        monkeypatch.setattr(geocode, "_geocoder", None)
+        first = geocode.get_geocoder()
+        assert geocode.get_geocoder() is first
+        assert geocode.get_geocoder().rate_limiter is first.rate_limiter
+
+    def test_new_event_loop_gets_fresh_rate_limiter(self, monkeypatch):
+        monkeypatch.setattr(geocode, "_geocoder", None)
+
+        async def contend():
+            limiter = geocode.get_geocoder().rate_limiter
+            limiter._interval = 0.001
+            await asyncio.gather(limiter.acquire(), limiter.acquire())
+            await geocode.close_http_client()
+            return limiter
+
+        first = asyncio.run(contend())
+        assert asyncio.run(contend()) is not first
+
+
+class TestGeocodePending:
+    @pytest.fixture
+    def fakes(self, monkeypatch):
+        calls = {"geocode": [], "updates": [], "peak": 0}
+        in_flight = 0
+
+        async def fake_geocode(name):
+            nonlocal in_flight
+            calls["geocode"].append(name)
+            in_flight += 1
+            calls["peak"] = max(calls["peak"], in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if name == "Boom":
+                raise RuntimeError("provider down")
+            if name == "Nowhere":
+                return geocode.GeocodeResult(query=name, source="nominatim")
+            return geocode.GeocodeResult(
+                query=name, latitude=1.0, longitude=2.0, source="nominatim",
+            )
+
+        async def fake_cached_many(names):
+            hit = {"latitude": 48.85, "longitude": 2.35, "source": "nominatim"}
+            return {"Paris, France": hit} if "Paris, France" in names else {}
+
+        async def fake_update(updates):
+            calls["updates"].append(sorted(u[0] for u in updates))
+
+        monkeypatch.setattr(geocode, "geocode_location", fake_geocode)
+        monkeypatch.setattr(geocode, "get_cached_geocode_many", fake_cached_many)
+        monkeypatch.setattr(geocode, "_memory_cache", geocode.OrderedDict())
+        monkeypatch.setattr(geocode, "update_location_geocodes", fake_update)
+        return calls
+
+    @staticmethod
+    def _rows(monkeypatch, *rows):
+        async def fake_locations(limit):
+            return [
+                {"id": i, "location_name": name, "location_type": kind}
+                for i, (name, kind) in enumerate(rows, start=1)
+            ]
+
+        monkeypatch.setattr(geocode, "get_ungeooded_locations", fake_locations)
+
+    async def test_concurrent_skips_global_and_batches_updates(self, monkeypatch, fakes):
+        self._rows(
+            monkeypatch,
+            ("Atlanta", "city"), ("Global", "global"), ("Paris", "city"), ("Nowhere", "city"),
+        )
+
+        stats = await geocode.geocode_pending_locations()
+
+        assert "Paris" not in fakes["geocode"]
+        assert fakes["peak"] > 1
+        assert fakes["updates"] == [[1, 3]]
+        assert stats == {
+            "total": 4, "geocoded": 2, "failed": 1, "cache_hits": 1, "cache_misses": 2,
+        }
+
+    async def test_duplicate_uncached_name_looked_up_once(self, monkeypatch, fakes):
+        self._rows(monkeypatch, ("Atlanta", "city"), ("  atlanta ", "city"), ("ATLANTA", "city"))
+
+        stats = await geocode.geocode_pending_locations()
+
+        assert fakes["geocode"] == ["Atlanta"]
+        assert fakes["updates"] == [[1, 2, 3]]
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hits"] == 2
+
+    async def test_failed_lookup_keeps_other_updates(self, monkeypatch, fakes):
+        self._rows(monkeypatch, ("Boom", "city"), ("Atlanta", "city"), ("Boom", "city"))
+
+        stats = await geocode.geocode_pending_locations()
+
+        assert fakes["updates"] == [[2]]
+        assert stats["geocoded"] == 1
+        assert stats["failed"] == 2
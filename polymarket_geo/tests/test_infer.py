@@ -55,3 +55,22 @@ def test_policy_defaults_country_to_capital_when_city_not_explicit() -> None:
     assert out.locations
     top = out.locations[0].name.lower()
     assert ("washington" in top) or ("united states" in top)
+
+
+def test_infer_batch_matches_single_inference() -> None:
+    engine = LocationInferenceEngine()
+    items = [
+        ("m1", "Will they rebuild scotiabank arena?", "Toronto city council is reviewing permits."),
+        ("m2", "U.S. strike on Somalia by February 7?", None),
+        ("m3", "Presidential Election Winner 2028", None),
+    ]
+    batched = engine.infer_batch(items, batch_size=2)
+
+    assert [r.condition_id for r in batched] == ["m1", "m2", "m3"]
+    for (cid, question, description), result in zip(items, batched):
+        single = engine.infer(cid, question, description)
+        assert [loc.location_name for loc in result.locations] == [
+            loc.location_name for loc in single.locations
+        ]
+        for a, b in zip(result.locations, single.locations):
+            assert abs(a.confidence - b.confidence) < 1e-6
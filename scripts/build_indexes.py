@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from dataclasses import asdict
 from pathlib import Path
 
 import numpy as np
@@ -33,8 +34,12 @@ def build(seed_file: Path, out_dir: Path, dim: int = 384) -> None:
     vectors = embedder.embed_many([r.searchable_text for r in records])
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    _write_jsonl(out_dir / "records.jsonl", [r.__dict__ for r in records])
-    np.save(out_dir / "vectors.npy", vectors)
+    _write_jsonl(out_dir / "records.jsonl", [asdict(r) for r in records])
+    # Running services mmap vectors.npy; swap the file instead of truncating it
+    tmp_file = out_dir / "vectors.npy.tmp"
+    with tmp_file.open("wb") as f:
+        np.save(f, vectors)
+    tmp_file.replace(out_dir / "vectors.npy")
 
 
 def main() -> None: